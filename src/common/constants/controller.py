@@ -7,8 +7,12 @@ BATTERY_CRITICAL_LEVEL = 10  # Percentage
 
 # Joystick
 JOYSTICK_DEAD_ZONE = 0.15
+JOYSTICK_DEAD_ZONE_SQ = JOYSTICK_DEAD_ZONE * JOYSTICK_DEAD_ZONE  # Compared against v * v
 JOYSTICK_VERTICAL_THRESHOLD = 0.50  # Joystick y
 JOYSTICK_HORIZONTAL_THRESHOLD = 0.50  # Joystick x
 
 # Trigger
 TRIGGER_THRESHOLD = 0.5
+
+# Feedback
+FEEDBACK_DEBOUNCE_MS = 30  # Repeats of the same effect within this window are ignored
@@ -59,18 +59,7 @@ class SpeedMode(Enum):
 
     @property
     def color(self) -> Tuple[int, int, int]:
-        if self.name == "STOP":
-            return (255, 255, 255)
-        elif self.name == "GEAR_1":
-            return (135, 206, 250)
-        elif self.name == "GEAR_2":
-            return (67, 198, 252)
-        elif self.name == "GEAR_3":
-            return (0, 191, 255)
-        elif self.name == "GEAR_4":
-            return (0, 0, 139)
-        else:
-            raise ValueError(f"Invalid speed value: {self.name}")
+        return _SPEED_MODE_COLORS[self]
 
     @staticmethod
     def get_speed_modes() -> List["SpeedMode"]:
@@ -92,6 +81,16 @@ class SpeedMode(Enum):
         ]
 
 
+# LED color of each speed mode
+_SPEED_MODE_COLORS = {
+    SpeedMode.STOP: (255, 255, 255),
+    SpeedMode.GEAR_1: (135, 206, 250),
+    SpeedMode.GEAR_2: (67, 198, 252),
+    SpeedMode.GEAR_3: (0, 191, 255),
+    SpeedMode.GEAR_4: (0, 0, 139),
+}
+
+
 class CurvedTurnRate(Enum):
     """Possible curved turn rates for the Rasptank.
 
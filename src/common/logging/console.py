@@ -167,6 +167,10 @@ class ConsoleLogger(Logger):
         # Terminate the program
         sys.exit(1)
 
+    def is_debug_enabled(self) -> bool:
+        """Return True if debug messages would be emitted by this logger."""
+        return self.logger.isEnabledFor(logging.DEBUG)
+
     def with_context(self, **kwargs: Any) -> "ConsoleLogger":
         """Return a new logger with additional persistent context."""
         new_context = self.context.copy()
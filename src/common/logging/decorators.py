@@ -28,24 +28,28 @@ def log_function_call(logger=None):
             # Get function details
             func_name = func.__name__
 
-            # Skip self for instance methods
-            args_str = (
-                ", ".join([str(a) for a in args[1:]])
-                if len(args) > 0 and hasattr(args[0], func_name)
-                else ", ".join([str(a) for a in args])
-            )
-            kwargs_str = ", ".join([f"{k}={v}" for k, v in kwargs.items()])
-            all_args = ", ".join(filter(None, [args_str, kwargs_str]))
-
-            # Log the call
-            current_logger.debugw(f"Calling {func_name}({all_args})")
+            # Only format the call when it will be logged
+            debug_enabled = current_logger.is_debug_enabled()
+            if debug_enabled:
+                # Skip self for instance methods
+                args_str = (
+                    ", ".join([str(a) for a in args[1:]])
+                    if len(args) > 0 and hasattr(args[0], func_name)
+                    else ", ".join([str(a) for a in args])
+                )
+                kwargs_str = ", ".join([f"{k}={v}" for k, v in kwargs.items()])
+                all_args = ", ".join(filter(None, [args_str, kwargs_str]))
+
+                # Log the call
+                current_logger.debugw(f"Calling {func_name}({all_args})")
 
             # Call the function and time it
             start_time = time.time()
             try:
                 result = func(*args, **kwargs)
-                elapsed = (time.time() - start_time) * 1000  # ms
-                current_logger.debugw(f"Completed {func_name} in {elapsed:.2f}ms")
+                if debug_enabled:
+                    elapsed = (time.time() - start_time) * 1000  # ms
+                    current_logger.debugw(f"Completed {func_name} in {elapsed:.2f}ms")
                 return result
             except Exception as e:
                 elapsed = (time.time() - start_time) * 1000  # ms
@@ -51,6 +51,11 @@ class Logger(ABC):
         """Log a fatal message with structured context and terminate the program."""
         pass
 
+    @abstractmethod
+    def is_debug_enabled(self) -> bool:
+        """Return True if debug messages would be emitted by this logger."""
+        pass
+
     @abstractmethod
     def with_context(self, **kwargs: Any) -> "Logger":
         """Return a new logger with additional persistent context."""
@@ -25,6 +25,9 @@ class NoOpLogger(Logger):
     def fatalw(self, msg: str, *args: Any, **kwargs: Any) -> None:
         pass
 
+    def is_debug_enabled(self) -> bool:
+        return False
+
     def with_context(self, **kwargs: Any) -> "Logger":
         return self
 
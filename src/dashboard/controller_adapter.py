@@ -10,7 +10,7 @@ from typing import Any, Callable, Dict, Optional
 # Import from src.common
 from src.common.constants.actions import ActionType
 from src.common.constants.controller import (
-    JOYSTICK_DEAD_ZONE,
+    JOYSTICK_DEAD_ZONE_SQ,
     JOYSTICK_HORIZONTAL_THRESHOLD,
     TRIGGER_THRESHOLD,
 )
@@ -57,6 +57,8 @@ class ControllerAdapter:
         """
         self.logger = controller_adapter_logger
         self.logger.infow("Initializing RaspTank Controller Adapter")
+        # Per-event debug logs are skipped entirely when debug logging is off
+        self._debug_enabled = self.logger.is_debug_enabled()
 
         self.controller = controller
         self.on_movement_command = on_movement_command
@@ -105,6 +107,8 @@ class ControllerAdapter:
             SpeedMode.get_speed_values()
         )  # Get the speed values for all speed modes except STOP
         self.current_speed_mode_idx = len(self.speed_values) // 2  # Start in the middle speed mode
+        # LED color of each speed mode, indexed like speed_modes
+        self.speed_mode_colors = tuple(speed_mode.color for speed_mode in self.speed_modes)
 
         # Last movement command sent
         self.last_movement = None
@@ -114,7 +118,7 @@ class ControllerAdapter:
 
         # Set initial LED color based on speed mode if feedback available
         if self.has_feedback:
-            r, g, b = self.speed_modes[self.current_speed_mode_idx].color
+            r, g, b = self.speed_mode_colors[self.current_speed_mode_idx]
             self.controller.feedback_collection.set_led_color(r, g, b)
 
         self.logger.infow("RaspTank Controller Adapter initialized with DualSense controller")
@@ -137,7 +141,8 @@ class ControllerAdapter:
             pressed (bool): Whether the button is pressed
         """
         # Log raw button event for debugging
-        self.logger.debugw("Button event", "button", button_name, "pressed", pressed)
+        if self._debug_enabled:
+            self.logger.debugw("Button event", "button", button_name, "pressed", pressed)
 
         # Handle speed control with L1 button (decrease speed)
         if button_name == ButtonType.L1.value and pressed:
@@ -159,7 +164,7 @@ class ControllerAdapter:
 
                 # Update LED color based on new speed mode and rumble
                 if self.has_feedback:
-                    r, g, b = self.speed_modes[self.current_speed_mode_idx].color
+                    r, g, b = self.speed_mode_colors[self.current_speed_mode_idx]
                     self.controller.feedback_collection.on_speed_change(r, g, b)
 
                 # Update movement with new speed if we're currently moving
@@ -174,7 +179,7 @@ class ControllerAdapter:
             else:
                 self.logger.debugw("Already at the lowest speed mode")
                 if self.has_feedback:
-                    r, g, b = self.speed_modes[self.current_speed_mode_idx].color
+                    r, g, b = self.speed_mode_colors[self.current_speed_mode_idx]
                     self.controller.feedback_collection.on_speed_out_of_bound(r, g, b)
 
             self.logger.debugw("L1 pressed", "speed_mode_after", self.current_speed_mode_idx)
@@ -199,7 +204,7 @@ class ControllerAdapter:
 
                 # Update LED color based on new speed mode and rumble
                 if self.has_feedback:
-                    r, g, b = self.speed_modes[self.current_speed_mode_idx].color
+                    r, g, b = self.speed_mode_colors[self.current_speed_mode_idx]
                     self.controller.feedback_collection.on_speed_change(r, g, b)
 
                 # Update movement with new speed if we're currently moving
@@ -214,7 +219,7 @@ class ControllerAdapter:
             else:
                 self.logger.debugw("Already at the highest speed mode")
                 if self.has_feedback:
-                    r, g, b = self.speed_modes[self.current_speed_mode_idx].color
+                    r, g, b = self.speed_mode_colors[self.current_speed_mode_idx]
                     self.controller.feedback_collection.on_speed_out_of_bound(r, g, b)
 
             self.logger.debugw("R1 pressed", "speed_mode_after", self.current_speed_mode_idx)
@@ -247,7 +252,7 @@ class ControllerAdapter:
 
     def _update_active_dpad_movements(self):
         """Update any active D-pad movements with the current pivot mode and speed."""
-        dpad_state = self.controller.get_status()["dpad"]
+        dpad_state = self.controller.get_status_view()["dpad"]
 
         # First check each direction
         if dpad_state["up"] and self.active_dpad_directions[DPadDirection.UP.value]:
@@ -320,15 +325,17 @@ class ControllerAdapter:
         if trigger_name == TriggerType.R2.value:
             # R2 for forward movement
             self.r2_trigger_value = value if value > TRIGGER_THRESHOLD else 0.0
-            self.logger.debugw(
-                "R2 trigger pressed", "value", value, "current_value", self.r2_trigger_value
-            )
+            if self._debug_enabled:
+                self.logger.debugw(
+                    "R2 trigger pressed", "value", value, "current_value", self.r2_trigger_value
+                )
         elif trigger_name == TriggerType.L2.value:
             # L2 for backward movement
             self.l2_trigger_value = value if value > TRIGGER_THRESHOLD else 0.0
-            self.logger.debugw(
-                "L2 trigger pressed", "value", value, "current_value", self.l2_trigger_value
-            )
+            if self._debug_enabled:
+                self.logger.debugw(
+                    "L2 trigger pressed", "value", value, "current_value", self.l2_trigger_value
+                )
 
         # Process combined movement from triggers and joystick
         self._process_combined_inputs()
@@ -380,7 +387,7 @@ class ControllerAdapter:
                 )
         else:
             # Handle button release events
-            dpad_state = self.controller.get_status()["dpad"]
+            dpad_state = self.controller.get_status_view()["dpad"]
 
             # If this specific direction was controlling movement, check if we need to stop
             if (
@@ -451,7 +458,7 @@ class ControllerAdapter:
         x = self.joystick_left_x  # -1 to 1 (negative = left, positive = right)
 
         # Apply dead zone
-        if abs(x) < JOYSTICK_DEAD_ZONE:
+        if x * x < JOYSTICK_DEAD_ZONE_SQ:
             self.turn_direction = TurnDirection.NONE
             self.turn_type = TurnType.NONE
             self.curved_turn_rate = CurvedTurnRate.NONE
@@ -488,14 +495,14 @@ class ControllerAdapter:
         """
         # Determine thrust direction based on triggers
         # If both triggers are pressed, priority goes to R2 (forward)
-        if hasattr(self, "r2_trigger_value") and self.r2_trigger_value > 0.4:
+        if self.r2_trigger_value > 0.4:
             self.thrust_direction = ThrustDirection.FORWARD
             # Scale speed by trigger value
             speed_idx = min(
                 len(self.speed_modes) - 1, int(self.r2_trigger_value * len(self.speed_modes))
             )
             speed_mode = self.speed_modes[speed_idx]
-        elif hasattr(self, "l2_trigger_value") and self.l2_trigger_value > 0.4:
+        elif self.l2_trigger_value > 0.4:
             self.thrust_direction = ThrustDirection.BACKWARD
             # Scale speed by trigger value
             speed_idx = min(
@@ -590,19 +597,20 @@ class ControllerAdapter:
             self.on_movement_command(
                 thrust_direction, turn_direction, turn_type, speed_mode, curved_turn_rate
             )
-            self.logger.debugw(
-                "Movement command sent",
-                "thrust_direction",
-                thrust_direction,
-                "turn_direction",
-                turn_direction,
-                "turn_type",
-                turn_type,
-                "speed_mode",
-                speed_mode,
-                "curved_turn_rate",
-                curved_turn_rate,
-            )
+            if self._debug_enabled:
+                self.logger.debugw(
+                    "Movement command sent",
+                    "thrust_direction",
+                    thrust_direction,
+                    "turn_direction",
+                    turn_direction,
+                    "turn_type",
+                    turn_type,
+                    "speed_mode",
+                    speed_mode,
+                    "curved_turn_rate",
+                    curved_turn_rate,
+                )
 
             if self.has_feedback:
                 self.controller.feedback_collection.on_move(
@@ -648,7 +656,7 @@ class ControllerAdapter:
             Dict: Status information
         """
         return {
-            "controller_connected": self.controller.get_status()["connected"],
+            "controller_connected": self.controller.get_status_view()["connected"],
             "last_movement": self.last_movement,
             "joystick_position": (self.joystick_left_x, self.joystick_left_y),
             "current_speed_mode_idx": self.current_speed_mode_idx,
@@ -31,6 +31,10 @@ from src.common.mqtt.client import MQTTClient
 
 # Import from src.dashboard
 from src.dashboard.controller_adapter import ControllerAdapter
+from src.dashboard.dualsense.base_controller import (
+    JOYSTICK_DEVICE_EVENT_TYPES,
+    JOYSTICK_EVENT_TYPES,
+)
 from src.dashboard.dualsense.controller import DualSenseController
 from src.dashboard.pygame_dashboard import RasptankPygameDashboard
 
@@ -311,32 +315,32 @@ def handle_game_event(client, topic, payload, qos, retain):
 # This function is kept for backwards compatibility but is not used when GUI is available
 def print_dashboard():
     """Print a simple text-based dashboard to the console."""
-    # Clear the screen (platform-dependent)
-    print("\033c", end="")
+    # Build the whole screen, then clear and write it in one go
+    lines = []
 
     # Print header
-    print("=" * 50)
-    print("   RASPTANK CONTROL DASHBOARD")
-    print("=" * 50)
+    lines.append("=" * 50)
+    lines.append("   RASPTANK CONTROL DASHBOARD")
+    lines.append("=" * 50)
 
     # Tank status
-    print(f"Tank connected: {tank_status['connected']}")
-    print(f"Power source:   {tank_status['power_source']}")
+    lines.append(f"Tank connected: {tank_status['connected']}")
+    lines.append(f"Power source:   {tank_status['power_source']}")
 
     if tank_status["power_source"] == "battery":
-        print(f"Battery:       {tank_status['battery']:.2f}%")
+        lines.append(f"Battery:       {tank_status['battery']:.2f}%")
 
     if tank_status["last_update"] > 0:
         time_since_update = time.time() - tank_status["last_update"]
-        print(f"Last update:    {time_since_update:.1f} seconds ago")
+        lines.append(f"Last update:    {time_since_update:.1f} seconds ago")
 
     # Controller status
     if dualsense_controller:
-        controller_status = dualsense_controller.get_status()
-        print(
+        controller_status = dualsense_controller.get_status_view()
+        lines.append(
             f"Controller:     {'Connected' if controller_status['connected'] else 'Disconnected'}"
         )
-        print(
+        lines.append(
             f"Feedback:       {'Enabled' if controller_status.get('has_feedback', False) else 'Disabled'}"
         )
 
@@ -355,7 +359,7 @@ def print_dashboard():
 
             current_speed_mode_idx = max(0, min(len(speed_modes) - 1, current_speed_mode_idx))
 
-            print(f"Speed Mode:     {formatted_speed_modes[current_speed_mode_idx]}")
+            lines.append(f"Speed Mode:     {formatted_speed_modes[current_speed_mode_idx]}")
 
             if adapter_status["last_movement"]:
                 (
@@ -369,23 +373,23 @@ def print_dashboard():
                     thrust_direction == ThrustDirection.NONE
                     and turn_direction == TurnDirection.NONE
                 ):
-                    print("Movement:       Stopped")
+                    lines.append("Movement:       Stopped")
                 else:
                     if turn_type == TurnType.CURVE:
-                        print(
+                        lines.append(
                             f"Movement:       {thrust_direction}, {turn_direction}, {turn_type}, {speed_mode} ({current_speed_value}%), {curved_turn_rate} ({curved_turn_rate.value * 100:.0f}%)"
                         )
                     else:
-                        print(
+                        lines.append(
                             f"Movement:       {thrust_direction}, {turn_direction}, {turn_type}, {speed_mode} ({current_speed_value}%)"
                         )
             else:
-                print("Movement:       Stopped")
+                lines.append("Movement:       Stopped")
 
             # Show joystick position
             if "joystick_position" in adapter_status:
                 x, y = adapter_status["joystick_position"]
-                print(f"Joystick:       X: {x:.2f}, Y: {y:.2f}")
+                lines.append(f"Joystick:       X: {x:.2f}, Y: {y:.2f}")
 
         else:
             # Display raw controller info if no movement adapter
@@ -393,20 +397,23 @@ def print_dashboard():
             if "left" in joysticks:
                 x, y = joysticks["left"]
                 if abs(x) > 0.1 or abs(y) > 0.1:
-                    print(f"Left Joystick:  X: {x:.2f}, Y: {y:.2f}")
+                    lines.append(f"Left Joystick:  X: {x:.2f}, Y: {y:.2f}")
 
             # Display active buttons
             buttons = controller_status.get("buttons", {})
             active_buttons = [name for name, pressed in buttons.items() if pressed]
             if active_buttons:
-                print(f"Active buttons: {', '.join(active_buttons)}")
+                lines.append(f"Active buttons: {', '.join(active_buttons)}")
     else:
-        print("Controller:     Disabled")
+        lines.append("Controller:     Disabled")
+
+    if dualsense_controller and dualsense_controller.get_status_view().get("has_feedback", False):
+        lines.append("\n-- FEEDBACK SYSTEM ACTIVE --")
 
-    if dualsense_controller and dualsense_controller.get_status().get("has_feedback", False):
-        print("\n-- FEEDBACK SYSTEM ACTIVE --")
+    lines.append("\nPress Ctrl+C to exit")
 
-    print("\nPress Ctrl+C to exit")
+    sys.stdout.write("\033c" + "\n".join(lines) + "\n")
+    sys.stdout.flush()
 
 
 def parse_arguments():
@@ -536,6 +543,10 @@ def main():
         pygame.init()
         pygame.joystick.init()
 
+        # Only queue the events we handle, so SDL drops the rest (mouse motion, etc.)
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed([pygame.QUIT, *JOYSTICK_EVENT_TYPES, *JOYSTICK_DEVICE_EVENT_TYPES])
+
         # Initialize the pygame dashboard (if not disabled)
         if not args.no_gui:
             controller_logger.infow("Initializing Pygame dashboard")
@@ -629,20 +640,20 @@ def main():
         last_controller_retry = 0
         connection_check_interval = 1.0  # Check connection status every second
         last_connection_check = 0
+        last_controller_state_version = -1
 
         controller_logger.infow("Running with threaded controller polling")
 
         while running:
             current_time = time.time()
 
-            if dualsense_controller and dualsense_controller.get_status()["connected"]:
-                pygame.event.pump()
+            if dualsense_controller and dualsense_controller.get_status_view()["connected"]:
                 dualsense_controller._process_events()
 
             # Try to connect controller if it's not connected (but not too frequently)
             if (
                 dualsense_controller
-                and not dualsense_controller.get_status()["connected"]
+                and not dualsense_controller.get_status_view()["connected"]
                 and current_time - last_controller_retry >= controller_retry_interval
             ):
                 controller_logger.infow("Attempting to reconnect DualSense controller")
@@ -671,8 +682,13 @@ def main():
                     # Update dashboard data
                     pygame_dashboard.update_tank_status(tank_status)
 
-                    if dualsense_controller:
+                    # Only copy the controller status when it changed since the last update
+                    if (
+                        dualsense_controller
+                        and dualsense_controller.state_version != last_controller_state_version
+                    ):
                         pygame_dashboard.update_controller_status(dualsense_controller.get_status())
+                        last_controller_state_version = dualsense_controller.state_version
 
                     if controller_adapter:
                         pygame_dashboard.update_movement_status(controller_adapter.get_status())
@@ -687,12 +703,22 @@ def main():
                 last_dashboard_update = current_time
 
             # Process any pygame window events - moved to main loop
-            for event in pygame.event.get():
+            # (controller input events are left queued for the controller)
+            events = pygame.event.get(exclude=JOYSTICK_EVENT_TYPES)
+            if not events:
+                # Wait up to 10ms for the next event instead of sleeping unconditionally,
+                # so input wakes the loop immediately and an idle loop stays blocked
+                events = [pygame.event.wait(10)]
+
+            for event in events:
                 if event.type == pygame.QUIT:
                     running = False
-
-            # Sleep to avoid busy waiting
-            time.sleep(0.01)  # 10ms sleep to reduce CPU usage
+                elif event.type in JOYSTICK_EVENT_TYPES and dualsense_controller:
+                    dualsense_controller.process_event(event)
+                elif event.type in JOYSTICK_DEVICE_EVENT_TYPES and dualsense_controller:
+                    # Retry the connection right away when a controller is plugged in
+                    if dualsense_controller.handle_device_event(event):
+                        last_controller_retry = 0
 
     except Exception as e:
         controller_logger.errorw("Error in main loop", "error", str(e), exc_info=True)
@@ -5,36 +5,73 @@ This module handles the common functionality for all game controllers.
 
 import threading
 import time
+from array import array
 from typing import Dict
 
 import pygame
 
 from src.common.logging.logger_api import Logger
 
+# Input events consumed by the controllers; other event readers must leave these queued
+JOYSTICK_EVENT_TYPES = (
+    pygame.JOYBUTTONDOWN,
+    pygame.JOYBUTTONUP,
+    pygame.JOYAXISMOTION,
+    pygame.JOYHATMOTION,
+)
+
+# Controller hot-plug events, handled by the controller owner through handle_device_event()
+JOYSTICK_DEVICE_EVENT_TYPES = (pygame.JOYDEVICEADDED, pygame.JOYDEVICEREMOVED)
+
 
 class BaseController:
     """Base class for game controllers using pygame."""
 
+    # Fixed attribute layout: faster attribute access on the input path, no per-instance dict
+    __slots__ = (
+        "logger",
+        "controller_state",
+        "state_version",
+        "joystick",
+        "controller_id",
+        "instance_id",
+        "num_buttons",
+        "num_axes",
+        "num_hats",
+        "axis_states",
+        "polling_thread",
+        "stop_event",
+        "poll_interval_ms",
+        "_connected",
+    )
+
     def __init__(self, base_controller_logger: Logger):
         """Initialize base controller state and resources."""
         self.logger = base_controller_logger
         self.logger.infow("Initializing base controller")
         # Initialize controller state
         self.controller_state = {"is_connected": False}
+        # Incremented on every controller_state change, so readers can skip unchanged state
+        self.state_version = 0
 
         # Initialize pygame joystick
         self.joystick = None
         self.controller_id = 0
+        self.instance_id = None  # Identifies this joystick's events in the event queue
 
-        # States for tracking changes
-        self.button_states = {}
-        self.prev_button_states = {}
-        self.axis_states = {}
-        self.prev_axis_states = {}
+        # Input counts, fixed once the joystick is connected
+        self.num_buttons = 0
+        self.num_axes = 0
+        self.num_hats = 0
+
+        # Raw axis values indexed by axis id (button state is kept by subclasses)
+        self.axis_states = array("d")
 
         # Threading for controller polling
         self.polling_thread = None
         self.stop_event = threading.Event()
+        self.poll_interval_ms = 10  # Polling thread period (~100Hz)
+        self._connected = threading.Event()  # Set while connected; the polling thread idles on it
 
         self.logger.infow("Base controller initialized")
 
@@ -71,6 +108,12 @@ class BaseController:
                 # Initialize the joystick
                 self.joystick = pygame.joystick.Joystick(self.controller_id)
                 self.joystick.init()
+                self.instance_id = self.joystick.get_instance_id()
+                self.num_buttons = self.joystick.get_numbuttons()
+                self.num_axes = self.joystick.get_numaxes()
+
+                # Input is read from the event queue, so make sure these events are not blocked
+                pygame.event.set_allowed(JOYSTICK_EVENT_TYPES)
 
                 # Log controller information
                 controller_name = self.joystick.get_name()
@@ -78,20 +121,24 @@ class BaseController:
                 self.logger.infow(
                     "Controller info",
                     "num_axes",
-                    self.joystick.get_numaxes(),
+                    self.num_axes,
                     "num_buttons",
-                    self.joystick.get_numbuttons(),
+                    self.num_buttons,
                 )
 
                 try:
-                    self.logger.infow("Hat info", "num_hats", self.joystick.get_numhats())
-                except:
+                    self.num_hats = self.joystick.get_numhats()
+                    self.logger.infow("Hat info", "num_hats", self.num_hats)
+                except pygame.error:
+                    self.num_hats = 0
                     self.logger.infow("Hat detection not supported")
 
                 # Initialize controller states
                 self._init_controller_states()
 
                 self.controller_state["is_connected"] = True
+                self.state_version += 1
+                self._connected.set()
                 self.logger.infow("Controller initialized successfully")
 
                 return True
@@ -104,20 +151,13 @@ class BaseController:
         return False
 
     def _init_controller_states(self):
-        """Initialize button and axis states.
+        """Initialize axis states.
 
         This method should be overridden by subclasses to initialize
         controller-specific state.
         """
-        # Initialize button states
-        for i in range(self.joystick.get_numbuttons()):
-            self.button_states[i] = False
-            self.prev_button_states[i] = False
-
         # Initialize axis states
-        for i in range(self.joystick.get_numaxes()):
-            self.axis_states[i] = 0.0
-            self.prev_axis_states[i] = 0.0
+        self.axis_states = array("d", bytes(8 * self.num_axes))
 
     def start(self, use_threading=True):
         """Start listening for controller events.
@@ -150,40 +190,107 @@ class BaseController:
         return True
 
     def _polling_loop(self):
-        """Main polling loop for controller events."""
+        """Main polling loop for controller events.
+
+        Drains the queued input events once per poll interval. The wait returns
+        as soon as stop() is called, so the thread never sleeps past a stop.
+        While no controller is connected the thread does not poll at all.
+        """
         while not self.stop_event.is_set():
+            # Idle until connected, waking periodically to notice stop()
+            if not self._connected.wait(timeout=0.5):
+                continue
+
             self._process_events()
-            time.sleep(0.01)  # Poll at ~100Hz
+            self.stop_event.wait(self.poll_interval_ms / 1000.0)
 
     def _process_events(self):
         """
         Process all pygame events and update controller state.
         This should be called from the main thread on macOS.
         """
-        try:
-            # Process all pygame events
-            pygame.event.pump()
+        # Update controller state from the queued input events
+        self._run_input_handler(self._read_controller_state)
 
-            # Update controller state based on current values
-            self._read_controller_state()
+    def process_event(self, event):
+        """Process a controller input event the caller already took from the pygame queue.
+
+        Errors are handled like in _process_events(), including the recovery
+        from a disconnect. Events are ignored while the controller is disconnected.
+
+        Args:
+            event: pygame controller input event (see JOYSTICK_EVENT_TYPES)
+        """
+        if not self.controller_state["is_connected"]:
+            return
+
+        self._run_input_handler(self._dispatch_events, [event])
+
+    def _run_input_handler(self, handler, *args):
+        """Run an input handler, logging its errors and recovering from a disconnect.
+
+        Args:
+            handler: Function reading or dispatching controller input
+            *args: Arguments passed to the handler
+        """
+        try:
+            handler(*args)
 
         except pygame.error as e:
             self.logger.errorw("Pygame error during event processing", "error", str(e))
             # If we lost connection to the controller, try to recover
             if "Invalid joystick device number" in str(e):
-                self.controller_state["is_connected"] = False
+                self._mark_disconnected()
                 self.logger.warnw("Controller disconnected. Attempting to reconnect...")
                 time.sleep(0.5)
                 self.setup(max_retries=1)
         except Exception as e:
             self.logger.errorw("Error processing controller events", "error", str(e))
 
+    def handle_device_event(self, event) -> bool:
+        """Handle a controller hot-plug event.
+
+        Args:
+            event: pygame JOYDEVICEADDED or JOYDEVICEREMOVED event
+
+        Returns:
+            bool: True if a controller was added while disconnected, so setup() should be retried
+        """
+        if event.type == pygame.JOYDEVICEREMOVED:
+            if event.instance_id == self.instance_id and self.controller_state["is_connected"]:
+                self._mark_disconnected()
+                self.logger.warnw("Controller removed", "instance_id", event.instance_id)
+            return False
+
+        if event.type == pygame.JOYDEVICEADDED:
+            return not self.controller_state["is_connected"]
+
+        return False
+
+    def _mark_disconnected(self):
+        """Record that the controller is no longer connected."""
+        self.controller_state["is_connected"] = False
+        self.state_version += 1
+        self._connected.clear()
+
     def _read_controller_state(self):
         """
         Read the current state of the controller.
 
         This method should be overridden by subclasses to handle
-        controller-specific state reading and event triggering.
+        controller-specific state reading and event triggering. Reading with
+        pygame.event.get() pumps the event loop, so no separate pump is needed.
+        """
+        pass
+
+    def _dispatch_events(self, events):
+        """
+        Dispatch controller input events to their handlers.
+
+        This method should be overridden by subclasses that handle input events.
+
+        Args:
+            events: pygame controller input events
         """
         pass
 
@@ -212,6 +319,6 @@ class BaseController:
             try:
                 self.logger.infow("Closing controller")
                 self.joystick.quit()
-                self.controller_state["is_connected"] = False
+                self._mark_disconnected()
             except Exception as e:
                 self.logger.errorw("Error closing controller", "error", str(e))
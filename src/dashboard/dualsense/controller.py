@@ -4,30 +4,87 @@ This module handles reading DualSense controller inputs and reporting raw inputs
 via callbacks.
 """
 
-from typing import Callable, Dict, Optional
+import os
+from functools import partial
+from types import MappingProxyType
+from typing import Callable, Dict, Mapping, Optional
+
+import pygame
 
 # Import from src.common
-from src.common.constants.controller import JOYSTICK_DEAD_ZONE
+from src.common.constants.controller import JOYSTICK_DEAD_ZONE_SQ
 from src.common.logging.logger_api import Logger
 
 # Import from src.dashboard
-from src.dashboard.dualsense.base_controller import BaseController
+from src.dashboard.dualsense.base_controller import JOYSTICK_EVENT_TYPES, BaseController
 from src.dashboard.dualsense.controller_mapping import (
     AXIS_MAPPING,
+    BUTTON_MAPPING,
     DPAD_BUTTON_MAPPING,
     DPAD_TYPE,
-    get_axis_name,
-    get_button_name,
 )
 from src.dashboard.dualsense.feedback.collection import DualsenseFeedbackCollection
 from src.dashboard.dualsense.feedback.feedback_main import DualSenseFeedback
 
+# D-pad directions in the order of the hat state tuple
+DPAD_DIRECTIONS = ("up", "down", "left", "right")
+
+# D-pad state as (up, down, left, right) for each of the 9 discrete hat positions
+DPAD_RELEASED = (False, False, False, False)
+HAT_TO_DPAD = {(x, y): (y == 1, y == -1, x == -1, x == 1) for x in (-1, 0, 1) for y in (-1, 0, 1)}
+
+
+def _names_by_id(mapping):
+    """Invert a name -> id mapping into a tuple indexed by id.
+
+    Args:
+        mapping (dict): Mapping of names to non-negative integer ids
+
+    Returns:
+        tuple: Name for each id, None for ids without a name
+    """
+    names = [None] * (max(mapping.values(), default=-1) + 1)
+    for name, input_id in mapping.items():
+        names[input_id] = name
+    return tuple(names)
+
 
 class DualSenseController(BaseController):
     """PlayStation 5 DualSense controller interface using pygame.
     This class reads raw inputs and reports them via callbacks.
     """
 
+    __slots__ = (
+        "_debug_enabled",
+        "on_button_event",
+        "on_joystick_event",
+        "on_trigger_event",
+        "on_dpad_event",
+        "_event_dispatch",
+        "_has_hat",
+        "_pending_axes",
+        "_status_cache",
+        "enable_feedback",
+        "feedback",
+        "feedback_collection",
+        "has_feedback",
+        "_last_hat",
+        "_dpad_prev",
+        "_button_names",
+        "_axis_names",
+        "_stick_axes",
+        "_axis_sticks",
+        "_axis_handlers",
+        "_dpad_button_names",
+        "_buttons_state",
+        "_joysticks_state",
+        "_triggers_state",
+        "_dpad_state",
+    )
+
+    # Zero out stick values inside the dead zone (bound as a default to skip the global lookup)
+    _apply_dz = staticmethod(lambda v, dz_sq=JOYSTICK_DEAD_ZONE_SQ: v if v * v >= dz_sq else 0.0)
+
     def __init__(
         self,
         dualsense_logger: Logger,
@@ -52,6 +109,8 @@ class DualSenseController(BaseController):
         """
         self.logger = dualsense_logger
         self.logger.infow("Initializing DualSense controller")
+        # Per-event debug logs are skipped entirely when debug logging is off
+        self._debug_enabled = self.logger.is_debug_enabled()
 
         base_controller_logger = dualsense_logger.with_component("base_controller")
         super().__init__(base_controller_logger)
@@ -62,6 +121,20 @@ class DualSenseController(BaseController):
         self.on_trigger_event = on_trigger_event
         self.on_dpad_event = on_dpad_event
 
+        # Input event handlers by pygame event type; the hat handler is added on connect
+        self._event_dispatch = {
+            pygame.JOYBUTTONDOWN: self._on_button_down,
+            pygame.JOYBUTTONUP: self._on_button_up,
+            pygame.JOYAXISMOTION: self._on_axis_motion,
+        }
+        self._has_hat = False
+
+        # Latest value per axis within the batch of events being dispatched
+        self._pending_axes = {}
+
+        # Last get_status() snapshot as (state_version, status)
+        self._status_cache = (-1, None)
+
         # Extend controller state with DualSense-specific data
         self.controller_state.update(
             {
@@ -71,6 +144,7 @@ class DualSenseController(BaseController):
                 "dpad": {"up": False, "down": False, "left": False, "right": False},
             }
         )
+        self._bind_state_groups()
 
         # Initialize feedback capabilities
         self.enable_feedback = enable_feedback
@@ -80,7 +154,10 @@ class DualSenseController(BaseController):
         if enable_feedback:
             try:
                 dualsense_feedback_logger = dualsense_logger.with_component("feedback")
-                self.feedback = DualSenseFeedback(dualsense_feedback_logger)
+                self.feedback = DualSenseFeedback(
+                    dualsense_feedback_logger,
+                    use_raw_hid=os.environ.get("RASPTANK_DUALSENSE_RAW_HID", "0") == "1",
+                )
                 dualsense_feedback_collection_logger = dualsense_logger.with_component(
                     "feedback_collection"
                 )
@@ -119,14 +196,67 @@ class DualSenseController(BaseController):
             "touchpad": False,
         }
 
+        # Hat events are only handled when the platform reports the D-pad as a hat the device has
+        self._has_hat = DPAD_TYPE == "hat" and self.num_hats > 0
+        if self._has_hat:
+            self._event_dispatch[pygame.JOYHATMOTION] = self._on_hat_motion
+        else:
+            self._event_dispatch.pop(pygame.JOYHATMOTION, None)
+
+        # Last raw hat value, and the D-pad state it produced as (up, down, left, right)
+        self._last_hat = (0, 0)
+        self._dpad_prev = DPAD_RELEASED
+
         self.controller_state["joysticks"] = {"left": (0.0, 0.0), "right": (0.0, 0.0)}
 
         self.controller_state["triggers"] = {"L2": 0.0, "R2": 0.0}
+        self._bind_state_groups()
+
+        # Names indexed by input id, so input events need no mapping scan
+        self._button_names = _names_by_id(BUTTON_MAPPING)
+        self._axis_names = _names_by_id(AXIS_MAPPING)
+
+        # Joystick (x, y) axis ids, and the joystick each axis id belongs to
+        self._stick_axes = {
+            "left": (AXIS_MAPPING["left_x"], AXIS_MAPPING["left_y"]),
+            "right": (AXIS_MAPPING["right_x"], AXIS_MAPPING["right_y"]),
+        }
+        axis_sticks = [None] * len(self._axis_names)
+        for stick, (x_axis, y_axis) in self._stick_axes.items():
+            axis_sticks[x_axis] = axis_sticks[y_axis] = stick
+        self._axis_sticks = tuple(axis_sticks)
+
+        # Trigger value handlers indexed by axis id, so axis events need no name comparisons;
+        # stick axes are dispatched per joystick instead (see _dispatch_events)
+        axis_handlers = [None] * len(self._axis_names)
+        for trigger in ("L2", "R2"):
+            axis_handlers[AXIS_MAPPING[trigger]] = partial(self._handle_trigger, trigger)
+        self._axis_handlers = tuple(axis_handlers)
+
+        # Cover every mapped axis id, so stick reads can index the axis states directly
+        missing_axes = len(self._axis_names) - len(self.axis_states)
+        if missing_axes > 0:
+            self.axis_states.extend([0.0] * missing_axes)
+        # D-pad buttons only exist when the platform reports the D-pad as buttons
+        self._dpad_button_names = (
+            _names_by_id(DPAD_BUTTON_MAPPING) if DPAD_TYPE == "buttons" else ()
+        )
 
         # Set default LED color if feedback is enabled
         if self.has_feedback:
             self.feedback.set_led_color(255, 255, 255)  # Default white
 
+    def _bind_state_groups(self):
+        """Keep direct references to the controller_state groups.
+
+        Input handlers write through these, one dict level instead of two.
+        Must be called again whenever a group dict is replaced.
+        """
+        self._buttons_state = self.controller_state["buttons"]
+        self._joysticks_state = self.controller_state["joysticks"]
+        self._triggers_state = self.controller_state["triggers"]
+        self._dpad_state = self.controller_state["dpad"]
+
     def start(self):
         """Start listening for controller events.
 
@@ -136,81 +266,118 @@ class DualSenseController(BaseController):
         return super().start(use_threading=True)
 
     def _read_controller_state(self):
-        """Read the current state of the DualSense controller."""
-        try:
-            if not self.joystick:
-                return
-
-            # Update previous button states
-            for button in self.button_states:
-                self.prev_button_states[button] = self.button_states[button]
-
-            # Update previous axis states
-            for axis in self.axis_states:
-                self.prev_axis_states[axis] = self.axis_states[axis]
-
-            # Update button states
-            for i in range(self.joystick.get_numbuttons()):
-                self.button_states[i] = self.joystick.get_button(i)
-
-                # Check for button state changes and handle them
-                if self.button_states[i] != self.prev_button_states.get(i, False):
-                    self._handle_button(i, self.button_states[i])
-
-            # Update axis states and handle joystick inputs
-            for i in range(self.joystick.get_numaxes()):
-                self.axis_states[i] = self.joystick.get_axis(i)
-
-                # Check if there's a significant change in axis value
-                if (
-                    abs(self.axis_states[i] - self.prev_axis_states.get(i, 0.0)) > 0.01
-                ):  # 1% change to avoid noise while also allowing for small changes
-                    self._handle_axis(i, self.axis_states[i])
-
-            # Try to read hat (D-pad) if available and we're using hat mode
-            if DPAD_TYPE == "hat":
-                try:
-                    if self.joystick.get_numhats() > 0:
-                        hat = self.joystick.get_hat(0)  # Usually D-pad is the first hat
-                        self._handle_hat(hat)
-                except:
-                    pass  # Hat might not be available on this controller
-
-        except Exception as e:
-            self.logger.errorw("Error reading controller state", "error", str(e))
+        """Read the pending input events of the DualSense controller.
 
-    def _handle_button(self, button_id, pressed):
-        """Handle raw button press/release events.
+        Only inputs that changed since the last call are queued by SDL, so an
+        idle controller costs a single queue check. The queue is drained until
+        empty, including events that arrive while earlier ones are handled.
+        Errors propagate to _process_events(), which handles disconnects.
+        """
+        if not self.joystick:
+            return
+
+        while True:
+            events = pygame.event.get(JOYSTICK_EVENT_TYPES)
+            if not events:
+                break
+            self._dispatch_events(events)
+
+    def _dispatch_events(self, events):
+        """Dispatch controller input events to their handlers.
+
+        Button and hat events are handled in order. Axis motion is coalesced to
+        the latest value per axis and handled once after the batch, since only
+        the final position matters. Each joystick is handled once per batch,
+        even when both of its axes moved.
 
         Args:
-            button_id (int): Button ID
-            pressed (bool): Whether the button is pressed
+            events (list): pygame joystick events
         """
-        button_name = get_button_name(button_id)
+        dispatch = self._event_dispatch
+        for event in events:
+            if event.instance_id != self.instance_id:
+                continue  # Event from another joystick
+
+            handler = dispatch.get(event.type)
+            if handler:
+                handler(event)
+
+        pending_axes = self._pending_axes
+        if pending_axes:
+            axis_sticks = self._axis_sticks
+            moved_sticks = set()
+            for axis_id, value in pending_axes.items():
+                stick = axis_sticks[axis_id] if axis_id < len(axis_sticks) else None
+                if stick:
+                    moved_sticks.add(stick)
+                else:
+                    self._handle_axis(axis_id, value)
+            pending_axes.clear()
 
-        if button_name:
-            # Update internal state
-            if button_name in self.controller_state["buttons"]:
-                self.controller_state["buttons"][button_name] = pressed
+            for stick in moved_sticks:
+                self._handle_stick(stick)
 
-                # Call button callback if provided
-                if self.on_button_event:
-                    self.on_button_event(button_name, pressed)
+    def _on_button_down(self, event):
+        """Handle a JOYBUTTONDOWN event."""
+        self._handle_button(event.button, True)
 
-                self.logger.debugw(f"Button event", "button", button_name, "pressed", pressed)
+    def _on_button_up(self, event):
+        """Handle a JOYBUTTONUP event."""
+        self._handle_button(event.button, False)
 
-        # Check if this is a D-pad button if we're using button mode for D-pad
-        elif DPAD_TYPE == "buttons":
-            for direction, dir_button_id in DPAD_BUTTON_MAPPING.items():
-                if button_id == dir_button_id:
-                    self.controller_state["dpad"][direction] = pressed
+    def _on_axis_motion(self, event):
+        """Handle a JOYAXISMOTION event."""
+        self.axis_states[event.axis] = event.value
+        self._pending_axes[event.axis] = event.value
 
-                    # Call dpad callback if provided
-                    if self.on_dpad_event:
-                        self.on_dpad_event(direction, pressed)
+    def _on_hat_motion(self, event):
+        """Handle a JOYHATMOTION event (only registered when the D-pad is a connected hat)."""
+        # D-pad is usually the first hat
+        if event.hat == 0:
+            self._handle_hat(event.value)
 
-                    self.logger.debugw(f"D-pad event", "direction", direction, "pressed", pressed)
-                    break
+    def _handle_button(self, button_id, pressed):
+        """Handle raw button press/release events.
+
+        Args:
+            button_id (int): Button ID
+            pressed (bool): Whether the button is pressed
+        """
+        button_names = self._button_names
+        button_name = button_names[button_id] if button_id < len(button_names) else None
+
+        if button_name:
+            # Update internal state (every mapped button is in the initialized state)
+            buttons = self._buttons_state
+            if buttons[button_name] == pressed:
+                return  # Repeated press/release, nothing changed
+            buttons[button_name] = pressed
+            self.state_version += 1
+
+            # Call button callback if provided
+            if self.on_button_event:
+                self.on_button_event(button_name, pressed)
+
+            if self._debug_enabled:
+                self.logger.debugw("Button event", "button", button_name, "pressed", pressed)
+
+        # Check if this is a D-pad button (table is empty unless the D-pad uses buttons)
+        else:
+            dpad_names = self._dpad_button_names
+            direction = dpad_names[button_id] if button_id < len(dpad_names) else None
+            if direction is not None:
+                dpad = self._dpad_state
+                if dpad[direction] == pressed:
+                    return  # Repeated press/release, nothing changed
+                dpad[direction] = pressed
+                self.state_version += 1
+
+                # Call dpad callback if provided
+                if self.on_dpad_event:
+                    self.on_dpad_event(direction, pressed)
+
+                if self._debug_enabled:
+                    self.logger.debugw("D-pad event", "direction", direction, "pressed", pressed)
 
     def _handle_axis(self, axis_id, value):
         """Handle raw axis value changes.
@@ -219,60 +386,55 @@ class DualSenseController(BaseController):
             axis_id (int): Axis ID
             value (float): Axis value (-1.0 to 1.0)
         """
-        axis_name = get_axis_name(axis_id)
+        axis_handlers = self._axis_handlers
+        handler = axis_handlers[axis_id] if axis_id < len(axis_handlers) else None
+        if handler:
+            handler(value)
 
-        if axis_name:
-            # Handle joystick axes
-            if axis_name == "left_x" or axis_name == "left_y":
-                left_x = self.axis_states.get(AXIS_MAPPING["left_x"], 0.0)
-                left_y = -self.axis_states.get(
-                    AXIS_MAPPING["left_y"], 0.0
-                )  # Invert Y so up is positive
+    def _handle_trigger(self, trigger, value):
+        """Handle a trigger axis value.
 
-                # Apply dead zone
-                if abs(left_x) < JOYSTICK_DEAD_ZONE:
-                    left_x = 0.0
-                if abs(left_y) < JOYSTICK_DEAD_ZONE:
-                    left_y = 0.0
-
-                # Update state
-                self.controller_state["joysticks"]["left"] = (left_x, left_y)
-
-                # Call joystick callback if provided
-                if self.on_joystick_event:
-                    self.on_joystick_event("left", left_x, left_y)
+        Args:
+            trigger (str): Trigger name ("L2" or "R2")
+            value (float): Axis value (-1.0 to 1.0)
+        """
+        # Normalize from -1.0...1.0 to 0.0...1.0
+        normalized = value * 0.5 + 0.5
 
-            elif axis_name == "right_x" or axis_name == "right_y":
-                right_x = self.axis_states.get(AXIS_MAPPING["right_x"], 0.0)
-                right_y = -self.axis_states.get(AXIS_MAPPING["right_y"], 0.0)  # Invert Y
+        # Only update and report when the normalized value changed
+        triggers = self._triggers_state
+        if normalized != triggers[trigger]:
+            triggers[trigger] = normalized
+            self.state_version += 1
 
-                # Apply dead zone
-                if abs(right_x) < JOYSTICK_DEAD_ZONE:
-                    right_x = 0.0
-                if abs(right_y) < JOYSTICK_DEAD_ZONE:
-                    right_y = 0.0
+            if self.on_trigger_event:
+                self.on_trigger_event(trigger, normalized)
 
-                # Update state
-                self.controller_state["joysticks"]["right"] = (right_x, right_y)
+    def _handle_stick(self, stick):
+        """Update a joystick from its current axis values.
 
-                # Call joystick callback if provided
-                if self.on_joystick_event:
-                    self.on_joystick_event("right", right_x, right_y)
+        Both axes are read together, so a move on both reports a single event.
 
-            # Handle triggers (normalize from -1.0...1.0 to 0.0...1.0)
-            elif axis_name == "L2":
-                L2_value = (value + 1) / 2
-                self.controller_state["triggers"]["L2"] = L2_value
+        Args:
+            stick (str): Joystick name ("left" or "right")
+        """
+        x_axis, y_axis = self._stick_axes[stick]
 
-                if self.on_trigger_event:
-                    self.on_trigger_event("L2", L2_value)
+        # Apply dead zone, inverting Y so up is positive
+        axis_states = self.axis_states
+        x = self._apply_dz(axis_states[x_axis])
+        y = self._apply_dz(-axis_states[y_axis])
 
-            elif axis_name == "R2":
-                R2_value = (value + 1) / 2
-                self.controller_state["triggers"]["R2"] = R2_value
+        # Only update and report when the processed position changed
+        position = (x, y)
+        joysticks = self._joysticks_state
+        if position != joysticks[stick]:
+            joysticks[stick] = position
+            self.state_version += 1
 
-                if self.on_trigger_event:
-                    self.on_trigger_event("R2", R2_value)
+            # Call joystick callback if provided
+            if self.on_joystick_event:
+                self.on_joystick_event(stick, x, y)
 
     def _handle_hat(self, hat_value):
         """Handle hat (D-pad) input.
@@ -280,46 +442,74 @@ class DualSenseController(BaseController):
         Args:
             hat_value (tuple): (x, y) values for the hat, typically (-1, 0, 1) for each axis
         """
-        x, y = hat_value
+        if hat_value == self._last_hat:
+            return  # Repeated hat value, nothing to recompute
+        self._last_hat = hat_value
 
-        # Update D-pad state
-        prev_dpad = self.controller_state["dpad"].copy()
+        # Compare the new (up, down, left, right) state against the last one
+        dpad = HAT_TO_DPAD.get(hat_value, DPAD_RELEASED)
+        prev_dpad = self._dpad_prev
+        if dpad == prev_dpad:
+            return
 
-        # Reset all directions first
-        self.controller_state["dpad"]["up"] = False
-        self.controller_state["dpad"]["down"] = False
-        self.controller_state["dpad"]["left"] = False
-        self.controller_state["dpad"]["right"] = False
+        self._dpad_prev = dpad
+        self.state_version += 1
 
-        # Set active directions
-        if y == 1:  # Up
-            self.controller_state["dpad"]["up"] = True
-        elif y == -1:  # Down
-            self.controller_state["dpad"]["down"] = True
-
-        if x == -1:  # Left
-            self.controller_state["dpad"]["left"] = True
-        elif x == 1:  # Right
-            self.controller_state["dpad"]["right"] = True
+        # Update D-pad state before callbacks, which may read the other directions
+        dpad_state = self._dpad_state
+        for direction, pressed in zip(DPAD_DIRECTIONS, dpad):
+            dpad_state[direction] = pressed
 
         # Trigger callbacks for changes
         if self.on_dpad_event:
-            for direction in ["up", "down", "left", "right"]:
-                if self.controller_state["dpad"][direction] != prev_dpad[direction]:
-                    self.on_dpad_event(direction, self.controller_state["dpad"][direction])
+            for direction, pressed, was_pressed in zip(DPAD_DIRECTIONS, dpad, prev_dpad):
+                if pressed != was_pressed:
+                    self.on_dpad_event(direction, pressed)
 
-    def get_status(self) -> Dict:
+    def get_status(self) -> Mapping:
         """Get the current controller status.
 
+        The snapshot is read-only and only rebuilt after the controller state
+        changed, so repeated calls on an idle controller copy nothing.
+
+        Returns:
+            Mapping: Read-only controller status information
+        """
+        # Read the version first: a change during the copy leaves the cache stale, not wrong
+        version = self.state_version
+        cached_version, status = self._status_cache
+        if cached_version == version:
+            return status
+
+        status = MappingProxyType(
+            {
+                "connected": self.controller_state["is_connected"],
+                "buttons": MappingProxyType(self.controller_state["buttons"].copy()),
+                "joysticks": MappingProxyType(self.controller_state["joysticks"].copy()),
+                "triggers": MappingProxyType(self.controller_state["triggers"].copy()),
+                "dpad": MappingProxyType(self.controller_state["dpad"].copy()),
+                "has_feedback": self.has_feedback,
+            }
+        )
+        self._status_cache = (version, status)
+        return status
+
+    def get_status_view(self) -> Dict:
+        """Get the current controller status without copying the state dicts.
+
+        The nested dicts are the live controller state; callers must treat them
+        as read-only and must not keep them across updates. Use get_status() for
+        a snapshot.
+
         Returns:
             Dict: Controller status information
         """
         return {
             "connected": self.controller_state["is_connected"],
-            "buttons": self.controller_state["buttons"].copy(),
-            "joysticks": self.controller_state["joysticks"].copy(),
-            "triggers": self.controller_state["triggers"].copy(),
-            "dpad": self.controller_state["dpad"].copy(),
+            "buttons": self.controller_state["buttons"],
+            "joysticks": self.controller_state["joysticks"],
+            "triggers": self.controller_state["triggers"],
+            "dpad": self.controller_state["dpad"],
             "has_feedback": self.has_feedback,
         }
 
@@ -344,7 +534,7 @@ class DualSenseController(BaseController):
             r, g, b: Color values (0-255)
 
         Returns:
-            bool: Success or failure
+            bool: True if the update was queued
         """
         if not self.has_feedback:
             return False
@@ -360,7 +550,7 @@ class DualSenseController(BaseController):
             duration_ms: Duration in milliseconds (0 = continuous until stopped)
 
         Returns:
-            bool: Success or failure
+            bool: True if the update was queued
         """
         if not self.has_feedback:
             return False
@@ -392,6 +582,6 @@ class DualSenseController(BaseController):
             try:
                 self.logger.infow("Closing controller")
                 self.joystick.quit()
-                self.controller_state["is_connected"] = False
+                self._mark_disconnected()
             except Exception as e:
                 self.logger.errorw("Error closing controller", "error", str(e))
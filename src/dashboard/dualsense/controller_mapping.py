@@ -5,6 +5,7 @@ across different platforms.
 """
 
 import sys
+from types import MappingProxyType
 
 # Platform detection
 IS_MACOS = sys.platform == "darwin"
@@ -133,6 +134,12 @@ else:  # Default Linux mappings
         "y": 7,  # -1 for up, 1 for down
     }
 
+# The mappings are read-only, so the reverse lookups built from them stay valid
+BUTTON_MAPPING = MappingProxyType(BUTTON_MAPPING)
+AXIS_MAPPING = MappingProxyType(AXIS_MAPPING)
+_BUTTON_ID_TO_NAME = {button_id: name for name, button_id in BUTTON_MAPPING.items()}
+_AXIS_ID_TO_NAME = {axis_id: name for name, axis_id in AXIS_MAPPING.items()}
+
 
 # Utility functions for button/axis name lookup
 def get_button_name(button_id):
@@ -144,10 +151,7 @@ def get_button_name(button_id):
     Returns:
         str: Button name or None if not found
     """
-    for name, id in BUTTON_MAPPING.items():
-        if id == button_id:
-            return name
-    return None
+    return _BUTTON_ID_TO_NAME.get(button_id)
 
 
 def get_button_id(button_name):
@@ -171,10 +175,7 @@ def get_axis_name(axis_id):
     Returns:
         str: Axis name or None if not found
     """
-    for name, id in AXIS_MAPPING.items():
-        if id == axis_id:
-            return name
-    return None
+    return _AXIS_ID_TO_NAME.get(axis_id)
 
 
 def get_axis_id(axis_name):
@@ -3,9 +3,15 @@
 import math
 import threading
 import time
+from array import array
 from enum import Enum, auto
+from typing import Tuple
 
-from src.common.constants.controller import BATTERY_CRITICAL_LEVEL, BATTERY_WARNING_LEVEL
+from src.common.constants.controller import (
+    BATTERY_CRITICAL_LEVEL,
+    BATTERY_WARNING_LEVEL,
+    FEEDBACK_DEBOUNCE_MS,
+)
 from src.common.constants.game import FLAG_CAPTURE_DURATION
 from src.common.enum.movement import (
     CurvedTurnRate,
@@ -15,7 +21,7 @@ from src.common.enum.movement import (
     TurnType,
 )
 from src.common.logging.logger_api import Logger
-from src.dashboard.dualsense.feedback.feedback_main import DualSenseFeedback
+from src.dashboard.dualsense.feedback.feedback_main import RUMBLE_LEVEL_MASK, DualSenseFeedback
 
 
 class FeedbackType(Enum):
@@ -35,6 +41,16 @@ class FeedbackType(Enum):
     SET_LED = auto()
 
 
+# Movement rumble (base intensity, variation, cycle time in seconds) for each speed mode
+_SPEED_RUMBLE_PARAMS = {
+    SpeedMode.STOP: (0, 0, 1),
+    SpeedMode.GEAR_1: (20000, 10000, 0.5),  # 70%, cycle reduced from 0.7 for more responsive feel
+    SpeedMode.GEAR_2: (30000, 15000, 0.4),  # 80%, cycle reduced from 0.6
+    SpeedMode.GEAR_3: (40000, 20000, 0.3),  # 90%, cycle reduced from 0.5
+    SpeedMode.GEAR_4: (50000, 25000, 0.2),  # 100%, cycle reduced from 0.4
+}
+
+
 class DualsenseFeedbackCollection:
     def __init__(self, dualsense_feedback_collection_logger: Logger, feedback: DualSenseFeedback):
         self.logger = dualsense_feedback_collection_logger
@@ -42,26 +58,50 @@ class DualsenseFeedbackCollection:
 
         self.feedback = feedback
         self.is_flag_capturing = False
+        # Set to end the flag capture feedback as soon as the capture ends
+        self._capture_cancel = threading.Event()
 
         # Current LED color (to restore after effects)
         self.current_led_color = (0, 0, 0)  # Default color (r, g, b)
 
         # For background tasks that need to run in threads
         self._running = True
-        self._rumble_active = False
+        # Bumped to retire the movement rumble; a pattern plays while its generation is current
+        self._rumble_generation = 0
 
         # Lock for thread safety when modifying shared state
         self._lock = threading.Lock()
 
-        # Current active rumble thread (for movement)
-        self._active_rumble_thread = None
+        # Movement rumble is played by a single worker thread. on_move() only leaves the
+        # latest pattern arguments, tagged with their generation, for it to pick up.
+        self._movement = None
+        self._movement_event = threading.Event()
+        self._movement_thread = threading.Thread(target=self._movement_loop, daemon=True)
+        self._movement_thread.start()
+
+        # Movement rumble lookup tables of each pattern played so far (movement worker only)
+        self._wave_cache = {}
+
+        # Last start time of each effect, used to debounce rapid repeats
+        self._last_effect_start = {}
+
+        # Effect sequences are played by a single worker thread, one at a time.
+        # Starting a sequence preempts the one playing.
+        self._sequence = None
+        self._sequence_event = threading.Event()
+        self._sequence_thread = threading.Thread(target=self._sequence_loop, daemon=True)
+        self._sequence_thread.start()
 
         self.logger.infow("Dualsense feedback collection initialized")
 
     def shutdown(self) -> None:
         """Shuts down the feedback collection."""
         self._running = False
-        self._rumble_active = False
+        with self._lock:
+            self._rumble_generation += 1
+        self._capture_cancel.set()
+        self._sequence_event.set()
+        self._movement_event.set()
         self.feedback.stop_rumble()
         self.logger.infow("Dualsense feedback collection shutdown")
 
@@ -69,42 +109,32 @@ class DualsenseFeedbackCollection:
 
     def on_speed_out_of_bound(self, r: int, g: int, b: int) -> None:
         """Provide immediate feedback when speed is out of bounds."""
+        if self._is_debounced(FeedbackType.SPEED_OUT_OF_BOUND):
+            return
+
         # Store the requested LED color
         self.current_led_color = (r, g, b)
 
-        # Provide immediate feedback
-        self.feedback.set_rumble(65535, 65535, 200)
-        self.feedback.set_led_color(r, g, b)
-
-        # Run the flash effect in a separate thread to not block
-        threading.Thread(target=self._run_speed_bound_effect, args=(r, g, b), daemon=True).start()
-
-    def _run_speed_bound_effect(self, r: int, g: int, b: int):
-        """Run the speed bound effect in background thread."""
-        for _ in range(2):  # Reduced to 2 flashes for quicker response
-            if not self._running:
-                break
-
-            time.sleep(0.15)
-            self.feedback.set_rumble(0, 0, 200)
-            self.feedback.set_led_color(0, 0, 0)  # Off
-            time.sleep(0.15)
-            self.feedback.set_rumble(65535, 65535, 200)
-            self.feedback.set_led_color(r, g, b)
-
-        # One final pulse to ensure it ends in the right state
-        time.sleep(0.1)
-        # Restore the LED color
-        self.feedback.set_led_color(r, g, b)
+        # Flash the LED with strong rumble, 2 flashes for quicker response
+        on = ((r, g, b), (65535, 65535), 200, 0.15)
+        off = ((0, 0, 0), (0, 0), 200, 0.15)
+        self._play_sequence(
+            [
+                on,
+                off,
+                on,
+                off,
+                ((r, g, b), (65535, 65535), 200, 0.1),
+                ((r, g, b), None, 0, 0),  # Ends in the requested color
+            ]
+        )
 
     def on_speed_change(self, r: int, g: int, b: int) -> None:
         """Provide immediate feedback when speed changes."""
-        # Store the requested LED color and update immediately
+        # Store the requested LED color, and update it together with a short,
+        # immediate rumble in a single feedback step
         self.current_led_color = (r, g, b)
-        self.feedback.set_led_color(r, g, b)
-
-        # Short, immediate rumble feedback
-        self.feedback.set_rumble(15000, 15000, 150)
+        self.feedback.set_state((r, g, b), (15000, 15000), 150)
 
     def on_move(
         self,
@@ -119,230 +149,168 @@ class DualsenseFeedbackCollection:
             self.stop_rumble()
             return
 
-        # Stop existing rumble thread
-        with self._lock:
-            self._rumble_active = False
-            if self._active_rumble_thread and self._active_rumble_thread.is_alive():
-                # Give the thread a moment to shut down
-                time.sleep(0.02)
-
-        # Start a new thread for continuous rumble
+        # Retire the current movement rumble and hand the new pattern to the worker.
+        # The old pattern stops writing as soon as its generation is no longer current.
         with self._lock:
-            self._rumble_active = True
-            self._active_rumble_thread = threading.Thread(
-                target=self._continuous_rumble,
-                args=(thrust_direction, turn_direction, turn_type, speed, curved_turn_rate),
-                daemon=True,
+            self._rumble_generation += 1
+            self._movement = (
+                self._rumble_generation,
+                thrust_direction,
+                turn_direction,
+                turn_type,
+                speed,
+                curved_turn_rate,
             )
-            self._active_rumble_thread.start()
+        self._movement_event.set()
 
     def stop_rumble(self) -> None:
         """Stop rumble with improved synchronization."""
+        # Retire the movement rumble and stop the rumble under the lock, so the
+        # worker cannot overwrite the stop with a late update
         with self._lock:
-            self._rumble_active = False
-
-        # Immediately stop the rumble effect
-        self.feedback.set_rumble(0, 0, 0)
+            self._rumble_generation += 1
+            self.feedback.set_rumble(0, 0, 0)
 
-        # Give any active thread a moment to shut down
-        time.sleep(0.01)
+        # Wake the worker so it leaves the retired pattern right away
+        self._movement_event.set()
 
     def on_shoot(self) -> None:
         """Provide immediate feedback when tank shoots."""
+        if self._is_debounced(FeedbackType.SHOOT):
+            return
+
         # Store current LED color
         r, g, b = self.current_led_color
 
-        # Immediate strong rumble effect
-        self.feedback.set_rumble(50000, 50000, 200)
-
-        # Flash LED red
-        self.feedback.set_led_color(255, 0, 0)  # Red
-
-        # Restore color after a short delay (in thread to not block)
-        def restore_color():
-            time.sleep(0.15)
-            self.feedback.set_led_color(r, g, b)
-
-        threading.Thread(target=restore_color, daemon=True).start()
+        # Immediate strong rumble effect and red LED flash, then restore the color
+        self._play_sequence(
+            [
+                ((255, 0, 0), (50000, 50000), 200, 0.15),  # Red
+                ((r, g, b), None, 0, 0),
+            ]
+        )
 
     def on_hit_by_shot(self) -> None:
         """Provide feedback when tank is hit by a shot."""
+        if self._is_debounced(FeedbackType.HIT_BY_SHOT):
+            return
+
         # Store current LED color
         r, g, b = self.current_led_color
 
-        # Immediate strong rumble
-        self.feedback.set_rumble(65535, 65535, 300)
-
-        # Start the effect in a background thread
-        threading.Thread(target=self._hit_effect, args=(r, g, b), daemon=True).start()
-
-    def _hit_effect(self, r: int, g: int, b: int):
-        """Run the hit effect in a background thread."""
-        # Flash LED red and vibrate, then transition to green to indicate recovery
-        start_time = time.time()
-        elapsed_time = 0
-
-        # Flash and transition over 1.5 seconds
-        while elapsed_time < 1.5 and self._running:
-            progress = elapsed_time / 1.5  # Progress from 0 to 1
-
-            # Transition from red to green
-            flash_r = int(255 * (1 - progress))
-            flash_g = int(255 * progress)
-            flash_b = 0
-
-            self.feedback.set_led_color(flash_r, flash_g, flash_b)
-            self.feedback.set_rumble(int(65535 * (1 - progress)), int(65535 * (1 - progress)), 100)
-            time.sleep(0.1)
-
-            if not self._running:
-                break
-
-            self.feedback.set_led_color(0, 0, 0)  # Off
-            time.sleep(0.05)
-
-            elapsed_time = time.time() - start_time
+        # Flash LED red and vibrate over 1.5 seconds, fading to green to indicate recovery.
+        # The first step is the immediate strong rumble, sent together with the red LED.
+        steps = []
+        for step in range(10):
+            progress = step / 10  # Progress from 0 to 1
+            rumble_intensity = int(65535 * (1 - progress))
+            steps.append(
+                (
+                    (int(255 * (1 - progress)), int(255 * progress), 0),
+                    (rumble_intensity, rumble_intensity),
+                    100,
+                    0.1,
+                )
+            )
+            steps.append(((0, 0, 0), None, 0, 0.05))  # Off
 
         # Restore LED to previous color
-        self.feedback.set_led_color(r, g, b)
-        self.feedback.set_rumble(0, 0, 0)
+        steps.append(((r, g, b), (0, 0), 0, 0))
+        self._play_sequence(steps)
 
     def on_capture_flag(self) -> None:
         """Feedback when flag capture starts."""
+        if self._is_debounced(FeedbackType.CAPTURE_FLAG):
+            return
+
         # Store purple color for flag capture (This avoids flickering)
         r, g, b = (255, 0, 255)  # Default color for flag capture
 
         # Set capturing flag immediately for other methods to check
         self.is_flag_capturing = True
+        self._capture_cancel.clear()
 
         # Start the flag capture feedback in a separate thread
         threading.Thread(target=self._capture_flag_feedback, args=(r, g, b), daemon=True).start()
 
     def _capture_flag_feedback(self, r: int, g: int, b: int):
         """Run flag capture feedback in a background thread."""
-        start_time = time.time()
-
-        # Run flag capture feedback loop
-        while (
-            time.time() - start_time < FLAG_CAPTURE_DURATION
-            and self.is_flag_capturing
-            and self._running
-        ):
-            self.feedback.set_led_color(255, 0, 255)  # Purple
-            self.feedback.set_rumble(20000, 20000, 100)
-            time.sleep(0.1)
-
-            if not self.is_flag_capturing or not self._running:
-                break
-
-            self.feedback.set_led_color(0, 0, 0)
-            self.feedback.set_rumble(0, 0, 100)
-            time.sleep(0.1)
-
-        # Set final color only if still capturing
-        if self.is_flag_capturing and self._running:
-            self.feedback.set_led_color(255, 0, 255)  # Purple
-        else:
-            # Restore original color if capture interrupted
-            self.feedback.set_led_color(r, g, b)
+        deadline_ns = time.monotonic_ns() + int(FLAG_CAPTURE_DURATION * 1_000_000_000)
+
+        # Run flag capture feedback loop; the waits end as soon as the capture ends
+        cancel = self._capture_cancel
+        while time.monotonic_ns() < deadline_ns:
+            self.feedback.set_state((255, 0, 255), (20000, 20000), 100)  # Purple
+            if cancel.wait(0.1):
+                # The capture result effect (or shutdown) takes over the LED
+                return
+
+            self.feedback.set_state((0, 0, 0), (0, 0), 100)
+            if cancel.wait(0.1):
+                return
+
+        # Still capturing after the feedback duration
+        self.feedback.set_led_color(r, g, b)
 
     def on_flag_captured(self) -> None:
         """Feedback when flag is captured."""
+        if self._is_debounced(FeedbackType.FLAG_CAPTURED):
+            return
+
         # Store current LED color
         r, g, b = self.current_led_color
 
         # Set flag capturing to false
         self.is_flag_capturing = False
+        self._capture_cancel.set()
 
-        # Immediate feedback
-        self.feedback.set_led_color(0, 255, 0)  # Green
-        self.feedback.set_rumble(65535, 65535, 200)
-
-        # Start victory effect in thread
-        threading.Thread(target=self._flag_captured_effect, args=(r, g, b), daemon=True).start()
-
-    def _flag_captured_effect(self, r: int, g: int, b: int):
-        """Run flag captured effect in background thread."""
-        # Flash green a few times
-        for _ in range(4):  # Reduced from 5 for quicker response
-            if not self._running:
-                break
-
-            time.sleep(0.1)
-            self.feedback.set_led_color(0, 0, 0)  # Off
-            self.feedback.set_rumble(0, 0, 100)
-            time.sleep(0.1)
-            self.feedback.set_led_color(0, 255, 0)  # Green
-            self.feedback.set_rumble(65535, 65535, 100)
-
-        # Restore LED to previous color
-        self.feedback.set_led_color(r, g, b)
-        self.feedback.set_rumble(0, 0, 0)
+        # Flash green a few times, then restore LED to previous color
+        green = ((0, 255, 0), (65535, 65535), 100, 0.1)
+        off = ((0, 0, 0), (0, 0), 100, 0.1)
+        self._play_sequence(
+            [((0, 255, 0), (65535, 65535), 200, 0.1)]
+            + [off, green] * 4  # Reduced from 5 for quicker response
+            + [((r, g, b), (0, 0), 0, 0)]
+        )
 
     def on_flag_capture_failed(self) -> None:
         """Feedback when flag capture fails."""
+        if self._is_debounced(FeedbackType.FLAG_CAPTURE_FAILED):
+            return
+
         # Store current LED color
         r, g, b = self.current_led_color
 
         # Immediately set flag to ensure other processes know we're done
         self.is_flag_capturing = False
-
-        # Immediate feedback
-        self.feedback.set_led_color(255, 0, 0)  # Red
-        self.feedback.set_rumble(65535, 65535, 200)
-
-        # Start fail effect in background
-        threading.Thread(
-            target=self._flag_capture_failed_effect, args=(r, g, b), daemon=True
-        ).start()
-
-    def _flag_capture_failed_effect(self, r: int, g: int, b: int):
-        """Run flag capture failed effect in background thread."""
-        for _ in range(1):  # Just one flash for quicker response
-            if not self._running:
-                break
-
-            time.sleep(0.2)
-            self.feedback.set_led_color(0, 0, 0)  # Off
-            time.sleep(0.1)
-            self.feedback.set_led_color(255, 0, 0)  # Red
-            self.feedback.set_rumble(65535, 65535, 200)
-
-        # Restore LED to previous color after a short delay
-        time.sleep(0.3)
-        self.feedback.set_led_color(r, g, b)
-        self.feedback.set_rumble(0, 0, 0)
+        self._capture_cancel.set()
+
+        # Just one flash for quicker response, then restore LED to previous color
+        self._play_sequence(
+            [
+                ((255, 0, 0), (65535, 65535), 200, 0.2),  # Red
+                ((0, 0, 0), None, 0, 0.1),  # Off
+                ((255, 0, 0), (65535, 65535), 200, 0.3),  # Red
+                ((r, g, b), (0, 0), 0, 0),
+            ]
+        )
 
     def on_pivot_mode(self) -> None:
         """Feedback when pivot mode is activated."""
+        if self._is_debounced(FeedbackType.PIVOT_MODE):
+            return
+
         # Store current LED color
         r, g, b = self.current_led_color
 
-        # Immediate feedback
-        self.feedback.set_led_color(255, 255, 0)  # Yellow
-        self.feedback.set_rumble(30000, 30000, 150)
-
-        # Start effect in background
-        threading.Thread(target=self._pivot_mode_effect, args=(r, g, b), daemon=True).start()
-
-    def _pivot_mode_effect(self, r: int, g: int, b: int):
-        """Run pivot mode effect in background thread."""
-        # Flash yellow a few times
-        for _ in range(3):  # Reduced from 5 for quicker response
-            if not self._running:
-                break
-
-            time.sleep(0.1)
-            self.feedback.set_led_color(0, 0, 0)  # Off
-            self.feedback.set_rumble(0, 0, 100)
-            time.sleep(0.05)
-            self.feedback.set_led_color(255, 255, 0)  # Yellow
-            self.feedback.set_rumble(30000, 30000, 100)
-
-        # Restore LED to previous color
-        time.sleep(0.1)
-        self.feedback.set_led_color(r, g, b)
-        self.feedback.set_rumble(0, 0, 0)
+        # Flash yellow a few times, then restore LED to previous color
+        yellow = ((255, 255, 0), (30000, 30000), 100, 0.1)
+        off = ((0, 0, 0), (0, 0), 100, 0.05)
+        self._play_sequence(
+            [((255, 255, 0), (30000, 30000), 150, 0.1)]
+            + [off, yellow] * 3  # Reduced from 5 for quicker response
+            + [((r, g, b), (0, 0), 0, 0)]
+        )
 
     def update_for_battery(self, battery_level: int) -> bool:
         """Update LED based on battery level."""
@@ -366,8 +334,95 @@ class DualsenseFeedbackCollection:
 
     # --- Private implementation details ---
 
+    def _is_debounced(self, feedback_type: FeedbackType) -> bool:
+        """Check whether an effect was already started within the debounce window.
+
+        Records the start time when the effect is allowed to run.
+
+        Args:
+            feedback_type: Effect being started
+
+        Returns:
+            bool: True if the effect should be skipped
+        """
+        now = time.monotonic()
+        with self._lock:
+            last_start = self._last_effect_start.get(feedback_type)
+            if last_start is not None and now - last_start < FEEDBACK_DEBOUNCE_MS / 1000.0:
+                return True
+            self._last_effect_start[feedback_type] = now
+        return False
+
+    def _play_sequence(self, steps) -> None:
+        """Hand an effect sequence to the sequence worker without blocking.
+
+        Args:
+            steps: List of (led_color, rumble, duration_ms, hold_sec) steps, where
+                led_color, rumble and duration_ms are passed to feedback.set_state()
+                and hold_sec is how long the step is held before the next one.
+                Fields repeating the previous step are not re-sent, except an
+                active rumble; the final step is always written in full.
+        """
+        with self._lock:
+            self._sequence = steps
+        self._sequence_event.set()
+
+    def _sequence_loop(self) -> None:
+        """Play effect sequences until the collection shuts down."""
+        while self._running:
+            self._sequence_event.wait()
+            with self._lock:
+                steps = self._sequence
+                self._sequence = None
+                self._sequence_event.clear()
+
+            if not steps:
+                continue
+
+            last_led_color = last_rumble = None
+            final_step = len(steps) - 1
+            for index, (led_color, rumble, duration_ms, hold_sec) in enumerate(steps):
+                if not self._running:
+                    return
+
+                if index == final_step:
+                    # Always written in full, so the sequence ends in its intended state
+                    self.feedback.set_state(led_color, rumble, duration_ms)
+                    break
+
+                # Only write what changed since the previous step. An active rumble is
+                # always re-sent, since each write restarts its duration.
+                changed_led_color = led_color if led_color != last_led_color else None
+                changed_rumble = (
+                    rumble
+                    if rumble is not None and (rumble != last_rumble or any(rumble))
+                    else None
+                )
+                self.feedback.set_state(changed_led_color, changed_rumble, duration_ms)
+                if led_color is not None:
+                    last_led_color = led_color
+                if rumble is not None:
+                    last_rumble = rumble
+
+                # A new sequence (or shutdown) sets the event and cuts the hold short
+                if hold_sec > 0 and self._sequence_event.wait(hold_sec):
+                    break
+
+    def _movement_loop(self) -> None:
+        """Play movement rumble patterns until the collection shuts down."""
+        while self._running:
+            self._movement_event.wait()
+            with self._lock:
+                movement = self._movement
+                self._movement = None
+                self._movement_event.clear()
+
+            if movement is not None:
+                self._continuous_rumble(*movement)
+
     def _continuous_rumble(
         self,
+        generation: int,
         thrust_direction: ThrustDirection,
         turn_direction: TurnDirection,
         turn_type: TurnType,
@@ -377,27 +432,9 @@ class DualsenseFeedbackCollection:
         """Create a continuous rumble pattern that simulates realistic tank movement."""
         try:
             # Base configuration based on speed
-            if speed == SpeedMode.STOP:
-                base_intensity = 0
-                variation = 0
-                cycle_time = 1
-            elif speed == SpeedMode.GEAR_1:  # 70%
-                base_intensity = 20000
-                variation = 10000
-                cycle_time = 0.5  # Reduced from 0.7 for more responsive feel
-            elif speed == SpeedMode.GEAR_2:  # 80%
-                base_intensity = 30000
-                variation = 15000
-                cycle_time = 0.4  # Reduced from 0.6
-            elif speed == SpeedMode.GEAR_3:  # 90%
-                base_intensity = 40000
-                variation = 20000
-                cycle_time = 0.3  # Reduced from 0.5
-            elif speed == SpeedMode.GEAR_4:  # 100%
-                base_intensity = 50000
-                variation = 25000
-                cycle_time = 0.2  # Reduced from 0.4
-            else:
+            try:
+                base_intensity, variation, cycle_time = _SPEED_RUMBLE_PARAMS[speed]
+            except KeyError:
                 raise ValueError("Invalid speed mode")
 
             # Default pattern (straight movement)
@@ -517,163 +554,213 @@ class DualsenseFeedbackCollection:
                     initial_left *= 1.1
                     initial_right *= 1.1
 
-            self.feedback.set_rumble(int(initial_left), int(initial_right), 80)
+            with self._lock:
+                if self._rumble_generation != generation:
+                    return
+                self.feedback.set_rumble(int(initial_left), int(initial_right), 80)
 
-            # Main rumble loop with thrust direction incorporated
-            start_time = time.time()
             update_rate = 0.01  # 100Hz updates for more responsive feel (reduced from 0.03)
 
-            while self._rumble_active and self._running:
-                elapsed = time.time() - start_time
+            # The pattern is periodic, so one period is sampled into lookup tables at the
+            # update rate instead of evaluating the waveform on every update. The tables
+            # only depend on the pattern arguments, so each pattern is sampled once.
+            pattern = (thrust_direction, turn_direction, turn_type, speed, curved_turn_rate)
+            tables = self._wave_cache.get(pattern)
+            if tables is None:
+                if pattern_style == "alternating":
+                    period = cycle_time * (0.6 if thrust_direction == ThrustDirection.NONE else 0.7)
+                elif pattern_style == "pivot":
+                    # Moving pivot has faster oscillation
+                    period = cycle_time * (0.8 if thrust_direction != ThrustDirection.NONE else 1.0)
+                else:
+                    period = cycle_time
+                samples = max(1, round(period / update_rate))
+                sample_time = period / samples
+
+                # Angular frequencies of the waves, computed once for all samples
+                omega = 2 * math.pi / cycle_time
+                track_omega = omega * 4  # Track oscillation runs at a quarter of the cycle time
+                period_omega = 2 * math.pi / period  # Spin and pivot waves
+
+                # Ensure feedback always feels present, except on a nearly stationary track
+                left_floor = 10000 if left_intensity_modifier > 0.2 else 0
+                right_floor = 10000 if right_intensity_modifier > 0.2 else 0
+
+                def intensities_at(elapsed: float) -> Tuple[int, int]:
+                    # Calculate primary oscillation patterns
+                    # Base pattern varies by thrust direction
+                    if thrust_direction == ThrustDirection.FORWARD:
+                        # Forward movement oscillation
+                        primary_wave_l = math.sin(elapsed * omega)
+                        primary_wave_r = math.sin(elapsed * omega + phase_difference)
+                    elif thrust_direction == ThrustDirection.BACKWARD:
+                        # Backward movement has different feel - cosine creates
+                        # different curve shape
+                        primary_wave_l = math.cos(elapsed * omega)
+                        primary_wave_r = math.cos(elapsed * omega + phase_difference)
+                    else:  # NONE - when only turning
+                        # Pure turning has simpler pattern
+                        primary_wave_l = math.sin(elapsed * omega)
+                        primary_wave_r = math.sin(elapsed * omega + phase_difference)
+
+                    # Apply different patterns based on movement type
+                    if pattern_style == "continuous":
+                        # Standard continuous pattern for straight movement
+                        left_intensity = int(base_intensity + primary_wave_l * variation)
+                        right_intensity = int(base_intensity + primary_wave_r * variation)
+
+                        # For pure thrust (no turning), add special patterns
+                        if (
+                            turn_direction == TurnDirection.NONE
+                            and thrust_direction != ThrustDirection.NONE
+                        ):
+                            # Add subtle tank track oscillation effect
+                            track_effect = math.sin(elapsed * track_omega) * variation * 0.3
+
+                            if thrust_direction == ThrustDirection.FORWARD:
+                                left_intensity += int(track_effect)
+                                right_intensity -= int(track_effect)
+                            else:  # BACKWARD
+                                left_intensity -= int(track_effect)
+                                right_intensity += int(track_effect)
+
+                    elif pattern_style == "differential":
+                        # Differential pattern for curve turns
+                        left_intensity = int(
+                            (base_intensity + primary_wave_l * variation) * left_intensity_modifier
+                        )
+                        right_intensity = int(
+                            (base_intensity + primary_wave_r * variation) * right_intensity_modifier
+                        )
 
-                # Calculate primary oscillation patterns
-                # Base pattern varies by thrust direction
-                if thrust_direction == ThrustDirection.FORWARD:
-                    # Forward movement oscillation
-                    primary_wave_l = math.sin(elapsed * (2 * math.pi / cycle_time))
-                    primary_wave_r = math.sin(
-                        elapsed * (2 * math.pi / cycle_time) + phase_difference
-                    )
-                elif thrust_direction == ThrustDirection.BACKWARD:
-                    # Backward movement has different feel - cosine creates different curve shape
-                    primary_wave_l = math.cos(elapsed * (2 * math.pi / cycle_time))
-                    primary_wave_r = math.cos(
-                        elapsed * (2 * math.pi / cycle_time) + phase_difference
-                    )
-                else:  # NONE - when only turning
-                    # Pure turning has simpler pattern
-                    primary_wave_l = math.sin(elapsed * (2 * math.pi / cycle_time))
-                    primary_wave_r = math.sin(
-                        elapsed * (2 * math.pi / cycle_time) + phase_difference
-                    )
+                    elif pattern_style == "alternating":
+                        # Alternating pattern for spin turns
+                        # Different pattern based on thrust
+                        if thrust_direction == ThrustDirection.NONE:
+                            # Pure spin effect
+                            left_wave = math.sin(elapsed * period_omega)
+                            right_wave = -left_wave  # Opposite direction
+                        else:
+                            # Spinning while thrusting - more complex pattern
+                            left_wave = math.sin(elapsed * period_omega)
+                            right_wave = -math.sin(
+                                elapsed * period_omega + 0.2
+                            )  # Slight phase shift
 
-                # Apply different patterns based on movement type
-                if pattern_style == "continuous":
-                    # Standard continuous pattern for straight movement
-                    left_intensity = int(base_intensity + primary_wave_l * variation)
-                    right_intensity = int(base_intensity + primary_wave_r * variation)
-
-                    # For pure thrust (no turning), add special patterns
-                    if (
-                        turn_direction == TurnDirection.NONE
-                        and thrust_direction != ThrustDirection.NONE
-                    ):
-                        # Add subtle tank track oscillation effect
-                        track_effect = (
-                            math.sin(elapsed * (2 * math.pi / (cycle_time * 0.25)))
-                            * variation
-                            * 0.3
+                        left_intensity = int(
+                            (base_intensity + left_wave * variation) * left_intensity_modifier
+                        )
+                        right_intensity = int(
+                            (base_intensity + right_wave * variation) * right_intensity_modifier
                         )
 
-                        if thrust_direction == ThrustDirection.FORWARD:
-                            left_intensity += int(track_effect)
-                            right_intensity -= int(track_effect)
-                        else:  # BACKWARD
-                            left_intensity -= int(track_effect)
-                            right_intensity += int(track_effect)
-
-                elif pattern_style == "differential":
-                    # Differential pattern for curve turns
-                    left_intensity = int(
-                        (base_intensity + primary_wave_l * variation) * left_intensity_modifier
-                    )
-                    right_intensity = int(
-                        (base_intensity + primary_wave_r * variation) * right_intensity_modifier
-                    )
+                    elif pattern_style == "pivot":
+                        # Pivot pattern - one track stationary, one active
+                        # Pivot feel depends on thrust direction (see period)
+                        if turn_direction == TurnDirection.LEFT:
+                            # Left pivot - minimal left track, strong right track
+                            left_intensity = int(base_intensity * 0.1)
+                            right_intensity = int(
+                                base_intensity + math.sin(elapsed * period_omega) * variation * 1.5
+                            )
+                        else:
+                            # Right pivot - strong left track, minimal right track
+                            left_intensity = int(
+                                base_intensity + math.sin(elapsed * period_omega) * variation * 1.5
+                            )
+                            right_intensity = int(base_intensity * 0.1)
 
-                elif pattern_style == "alternating":
-                    # Alternating pattern for spin turns
-                    # Different pattern based on thrust
-                    if thrust_direction == ThrustDirection.NONE:
-                        # Pure spin effect
-                        left_wave = math.sin(elapsed * (2 * math.pi / (cycle_time * 0.6)))
-                        right_wave = -left_wave  # Opposite direction
-                    else:
-                        # Spinning while thrusting - more complex pattern
-                        left_wave = math.sin(elapsed * (2 * math.pi / (cycle_time * 0.7)))
-                        right_wave = -math.sin(
-                            elapsed * (2 * math.pi / (cycle_time * 0.7)) + 0.2
-                        )  # Slight phase shift
-
-                    left_intensity = int(
-                        (base_intensity + left_wave * variation) * left_intensity_modifier
-                    )
-                    right_intensity = int(
-                        (base_intensity + right_wave * variation) * right_intensity_modifier
+                    # Ensure values are within valid range and above the floor
+                    return (
+                        max(left_floor, min(65535, left_intensity)),
+                        max(right_floor, min(65535, right_intensity)),
                     )
 
-                elif pattern_style == "pivot":
-                    # Pivot pattern - one track stationary, one active
-                    # Pivot feel depends on thrust direction
-                    pivot_speed = cycle_time
-                    if thrust_direction != ThrustDirection.NONE:
-                        # Moving pivot has faster oscillation
-                        pivot_speed *= 0.8
+                # Samples are stored at the motor resolution, so neighbouring samples that
+                # drive the motors the same way compare equal in the loop below
+                left_table = array("H")
+                right_table = array("H")
+                for sample in range(samples):
+                    left_intensity, right_intensity = intensities_at(sample * sample_time)
+                    left_table.append(left_intensity & RUMBLE_LEVEL_MASK)
+                    right_table.append(right_intensity & RUMBLE_LEVEL_MASK)
+
+                tables = (left_table, right_table, sample_time)
+                self._wave_cache[pattern] = tables
+            left_table, right_table, sample_time = tables
+            samples = len(left_table)
+
+            # Unchanged values are only re-sent to keep the 50 ms rumble from running out
+            keep_alive = 0.03
+            last_low = last_high = -1
+            last_send_time = 0.0
 
-                    if turn_direction == TurnDirection.LEFT:
-                        # Left pivot - minimal left track, strong right track
-                        left_intensity = int(base_intensity * 0.1)
-                        right_intensity = int(
-                            base_intensity
-                            + math.sin(elapsed * (2 * math.pi / pivot_speed)) * variation * 1.5
-                        )
-                    else:
-                        # Right pivot - strong left track, minimal right track
-                        left_intensity = int(
-                            base_intensity
-                            + math.sin(elapsed * (2 * math.pi / pivot_speed)) * variation * 1.5
-                        )
-                        right_intensity = int(base_intensity * 0.1)
+            # Main rumble loop with thrust direction incorporated
+            # Updates are scheduled on absolute monotonic deadlines, so wait jitter does
+            # not accumulate into the update rate
+            # Loop-local names for what is looked up on every update
+            monotonic = time.monotonic
+            set_rumble = self.feedback.set_rumble
+            wait = self._movement_event.wait
+            lock = self._lock
 
-                # Ensure values are within valid range
-                left_intensity = max(0, min(65535, left_intensity))
-                right_intensity = max(0, min(65535, right_intensity))
+            start_time = monotonic()
+            next_update = start_time
 
-                # Ensure feedback always feels present
-                left_intensity = (
-                    max(10000, left_intensity) if left_intensity_modifier > 0.2 else left_intensity
-                )
-                right_intensity = (
-                    max(10000, right_intensity)
-                    if right_intensity_modifier > 0.2
-                    else right_intensity
-                )
+            while self._rumble_generation == generation and self._running:
+                now = monotonic()
+                index = int((now - start_time) / sample_time) % samples
 
                 # Apply the rumble effect
-                low_freq_motor = left_intensity  # Left side/handle
-                high_freq_motor = right_intensity  # Right side/handle
-
-                # Check if thread should still be running
-                if not self._rumble_active or not self._running:
-                    break
-
-                # Apply rumble with shorter duration for more responsive updates
-                self.feedback.set_rumble(low_freq_motor, high_freq_motor, 50)
-
-                # Shorter sleep for more responsive updates
-                time.sleep(update_rate)
+                low_freq_motor = left_table[index]  # Left side/handle
+                high_freq_motor = right_table[index]  # Right side/handle
+
+                if (
+                    low_freq_motor != last_low
+                    or high_freq_motor != last_high
+                    or now - last_send_time >= keep_alive
+                ):
+                    # Apply rumble with shorter duration for more responsive updates,
+                    # unless the thread was retired while computing it
+                    with lock:
+                        if self._rumble_generation != generation or not self._running:
+                            break
+                        set_rumble(low_freq_motor, high_freq_motor, 50)
+                    last_low = low_freq_motor
+                    last_high = high_freq_motor
+                    last_send_time = now
+
+                # Shorter sleep for more responsive updates; a new pattern cuts it short.
+                # After falling behind, the schedule restarts from now instead of bunching up.
+                next_update += update_rate
+                if next_update <= now:
+                    next_update = now + update_rate
+                wait(max(0.0, next_update - monotonic()))
 
         except Exception as e:
             self.logger.errorw("Rumble error", "error", str(e))
         finally:
-            # Ensure rumble is stopped when thread ends
-            self.feedback.set_rumble(0, 0, 0)
+            # Ensure rumble is stopped when thread ends, unless a newer thread owns it
+            with self._lock:
+                if self._rumble_generation == generation:
+                    self.feedback.set_rumble(0, 0, 0)
 
     def _handle_update_battery(self, battery_level: int) -> None:
         """Immediately update LED based on battery level."""
         if not self.feedback.initialized:
             return
 
-        # Handle low battery warning with immediate visual feedback
+        # Handle low battery warning with immediate visual feedback. The color only
+        # changes when the flash phase flips; repeats are dropped by the feedback writer.
         if battery_level <= BATTERY_CRITICAL_LEVEL:
-            # Critical battery - red flashing
-            if time.time() % 0.6 < 0.3:  # Fast flashing
+            # Critical battery - red flashing, 0.3 s per phase
+            if (time.monotonic_ns() // 300_000_000) & 1 == 0:  # Fast flashing
                 self.feedback.set_led_color(255, 0, 0)  # Bright red
             else:
                 self.feedback.set_led_color(50, 0, 0)  # Dim red
         elif battery_level <= BATTERY_WARNING_LEVEL:
-            # Low battery - orange pulsing
-            if time.time() % 2 < 1:  # Slow pulsing
+            # Low battery - orange pulsing, 1 s per phase
+            if (time.monotonic_ns() // 1_000_000_000) & 1 == 0:  # Slow pulsing
                 self.feedback.set_led_color(255, 128, 0)  # Orange
             else:
                 self.feedback.set_led_color(50, 25, 0)  # Dim orange
@@ -3,9 +3,13 @@ DualSense Feedback Extension Module with improved rumble control
 Adds rumble and LED support to the DualSense controller integration.
 """
 
+import ctypes
+import heapq
+import itertools
+import sys
 import threading
 import time
-from typing import Any
+from typing import Any, Optional, Tuple
 
 # Try to import SDL2 dependencies, but allow fallback if not available
 try:
@@ -16,14 +20,94 @@ try:
 except ImportError:
     SDL2_AVAILABLE = False
 
+# hidapi lets LED and rumble go out in a single output report (opt-in, see DualSenseFeedback)
+try:
+    import hid
+
+    HIDAPI_AVAILABLE = True
+except ImportError:
+    HIDAPI_AVAILABLE = False
+
 from src.common.logging.logger_api import Logger
 
+# Bound once, used on every haptic effect update
+_byref = ctypes.byref
+
+# Rumble intensity bits that reach the DualSense motors (8-bit levels in the high byte)
+RUMBLE_LEVEL_MASK = 0xFF00
+
+# Upper bound for rumble durations; larger values overflow SDL's expiration time
+MAX_RUMBLE_DURATION_MS = 3_600_000  # 1 hour
+
+# DualSense USB output report, carrying both the rumble and the LED state
+DUALSENSE_VENDOR_ID = 0x054C
+DUALSENSE_PRODUCT_ID = 0x0CE6
+HID_REPORT_ID = 0x02
+HID_REPORT_SIZE = 48
+HID_FLAGS_RUMBLE = 0x03  # Byte 1: compatible vibration, haptics select
+HID_FLAGS_LED = 0x04  # Byte 2: lightbar color
+HID_RIGHT_MOTOR = 3  # High frequency motor
+HID_LEFT_MOTOR = 4  # Low frequency motor
+HID_LED_RED = 45  # Followed by green and blue
+
+
+def _rumble_level(intensity) -> int:
+    """Convert a rumble intensity to the level written to the motors.
+
+    Intensities outside 0-65535 are clamped instead of wrapping around, and the
+    low byte the motors ignore is dropped (see RUMBLE_LEVEL_MASK).
+
+    Args:
+        intensity: Rumble intensity (0-65535)
+
+    Returns:
+        int: Motor level
+    """
+    return min(max(int(intensity), 0), 0xFFFF) & RUMBLE_LEVEL_MASK
+
 
 class DualSenseFeedback:
     """Class to add rumble and LED functionality to DualSense controller."""
 
-    def __init__(self, dualsense_feedback_logger: Logger):
-        """Initialize the DualSense feedback controller."""
+    # Fixed attribute layout: faster attribute access on the write path, no per-instance dict
+    __slots__ = (
+        "logger",
+        "sdl_controller",
+        "joystick",
+        "haptic",
+        "initialized",
+        "controller_name",
+        "_rumble_thread",
+        "_stop_rumble",
+        "_rumble_deadline",
+        "_written_rumble",
+        "_written_led",
+        "_haptic_effect",
+        "_haptic_effect_id",
+        "_haptic_run",
+        "_io_timers",
+        "_io_timer_seq",
+        "_sdl_rumble",
+        "_sdl_set_led",
+        "_use_raw_hid",
+        "_hid_device",
+        "_hid_report",
+        "_pending_led",
+        "_pending_rumble",
+        "_io_lock",
+        "_io_event",
+        "_io_stop",
+        "_io_thread",
+    )
+
+    def __init__(self, dualsense_feedback_logger: Logger, use_raw_hid: bool = False):
+        """Initialize the DualSense feedback controller.
+
+        Args:
+            dualsense_feedback_logger: Logger instance
+            use_raw_hid: Write USB output reports with hidapi instead of SDL's controller
+                driver (see _open_hid_device)
+        """
         self.logger = dualsense_feedback_logger
         self.logger.infow("Initializing DualSense feedback controller")
 
@@ -34,19 +118,49 @@ class DualSenseFeedback:
         self.controller_name = ""
         self._rumble_thread = None
         self._stop_rumble = threading.Event()
-        self._rumble_timer = None  # For short duration rumbles
+        self._rumble_deadline = None  # Monotonic time a timed rumble is stopped at (I/O thread)
+        self._written_rumble = None  # Last (low, high) sent to the motors, None if unknown
+        self._written_led = None  # Last (r, g, b) sent to the LED, None if unknown
+
+        # Haptic fallback effect: the struct is allocated with the haptic device, the
+        # device effect is created on first use, and both are updated in place afterwards
+        self._haptic_effect = None
+        self._haptic_effect_id = None
+        self._haptic_run = 0  # Incremented on every run, so stale scheduled stops are ignored
+        self._io_timers = []  # Heap of (deadline, seq, callback) run by the I/O thread
+        self._io_timer_seq = itertools.count()  # Tie-breaker for equal deadlines
+
+        # SDL feedback functions, bound once SDL is initialized (None if unsupported)
+        self._sdl_rumble = None
+        self._sdl_set_led = None
+
+        # Raw HID output for USB controllers (None if unavailable, SDL is used instead)
+        self._use_raw_hid = use_raw_hid
+        self._hid_device = None
+        self._hid_report = bytearray(HID_REPORT_SIZE)
+        self._hid_report[0] = HID_REPORT_ID
+
+        # Single-slot mailboxes drained by the I/O thread, newest value wins
+        self._pending_led = None  # (r, g, b)
+        self._pending_rumble = None  # (low_freq, high_freq, duration_ms)
+        self._io_lock = threading.Lock()
+        self._io_event = threading.Event()
+        self._io_stop = False
+        self._io_thread = None
 
         # Initialize SDL if available
         if SDL2_AVAILABLE:
-            self._initialize_sdl()
+            if self._initialize_sdl():
+                self._start_io_thread()
         else:
             self.logger.warnw("SDL2 not available, DualSense feedback features will be disabled")
 
     def _initialize_sdl(self):
         """Initialize SDL2 for DualSense feedback features."""
         try:
-            # Initialize SDL2 with required subsystems
-            if sdl2.SDL_Init(sdl2.SDL_INIT_GAMECONTROLLER | sdl2.SDL_INIT_HAPTIC) != 0:
+            # Initialize SDL2 with the game controller subsystem; the slow haptic
+            # subsystem is only initialized later if it is needed (see _init_haptic)
+            if sdl2.SDL_Init(sdl2.SDL_INIT_GAMECONTROLLER) != 0:
                 error = sdl2.SDL_GetError().decode("utf-8")
                 self.logger.errorw("SDL2 initialization error", "error", error)
                 return False
@@ -75,13 +189,12 @@ class DualSenseFeedback:
                         self.sdl_controller = temp_controller
                         self.controller_name = name
 
-                        # Initialize haptic feedback if available
-                        joystick = sdl2.SDL_GameControllerGetJoystick(self.sdl_controller)
-                        self.haptic = sdl2.SDL_HapticOpenFromJoystick(joystick)
-
+                        self._bind_sdl_functions()
+                        if self._use_raw_hid:
+                            self._open_hid_device()
                         self.initialized = True
                         self.logger.infow(
-                            f"SDL2 initialized for DualSense feedback", "controller_name", name
+                            "SDL2 initialized for DualSense feedback", "controller_name", name
                         )
                         return True
                     else:
@@ -99,102 +212,409 @@ class DualSenseFeedback:
             self.logger.errorw("Error initializing SDL2", "error", str(e))
             return False
 
+    def _bind_sdl_functions(self):
+        """Bind the SDL feedback functions once instead of resolving them on every write.
+
+        Functions missing from the installed SDL2 bindings are left as None and
+        reported once here; the writes then fail without further logging.
+        """
+        self._sdl_rumble = getattr(sdl2, "SDL_GameControllerRumble", None)
+        self._sdl_set_led = getattr(sdl2, "SDL_GameControllerSetLED", None)
+        if self._sdl_set_led is None:
+            self.logger.warnw("LED control not supported in this SDL2 version")
+
+    def _open_hid_device(self):
+        """Open the DualSense for raw HID output reports if it is connected over USB.
+
+        The reports bypass SDL's PS5 driver, which still has the device open and
+        writes the same output report, so this path is opt-in. Bluetooth uses a
+        different report layout, so it stays on SDL.
+        """
+        if not HIDAPI_AVAILABLE:
+            self.logger.warnw("hidapi not available, using SDL for DualSense feedback")
+            return
+
+        if sys.platform == "darwin":
+            # hidapi opens devices exclusively on macOS, which would cut off pygame's input
+            self.logger.warnw("Raw HID output is not supported on macOS, using SDL")
+            return
+
+        try:
+            for info in hid.enumerate(DUALSENSE_VENDOR_ID, DUALSENSE_PRODUCT_ID):
+                # Only USB devices report an interface number
+                if info.get("interface_number", -1) < 0:
+                    continue
+
+                device = hid.device()
+                device.open_path(info["path"])
+                self._hid_device = device
+                self.logger.infow("Using raw HID output reports for DualSense feedback")
+                return
+        except Exception as e:
+            self.logger.warnw("Could not open DualSense HID device", "error", str(e))
+
+    def _close_hid_device(self):
+        """Close the raw HID device and return to the SDL feedback functions."""
+        device, self._hid_device = self._hid_device, None
+        if device is None:
+            return
+
+        try:
+            device.close()
+        except Exception as e:
+            self.logger.warnw("Error closing DualSense HID device", "error", str(e))
+
+        # The controller state is unknown after a failed write
+        self._written_led = None
+        self._written_rumble = None
+
+    def _init_haptic(self):
+        """Open the haptic device used as the rumble fallback.
+
+        Initializing SDL's haptic subsystem can take seconds, so this runs on
+        the I/O thread instead of during startup.
+        """
+        try:
+            if sdl2.SDL_InitSubSystem(sdl2.SDL_INIT_HAPTIC) != 0:
+                error = sdl2.SDL_GetError().decode("utf-8")
+                self.logger.warnw("SDL2 haptic initialization error", "error", error)
+                return
+
+            joystick = sdl2.SDL_GameControllerGetJoystick(self.sdl_controller)
+            haptic = sdl2.SDL_HapticOpenFromJoystick(joystick)
+            if not haptic:
+                self.logger.warnw("Rumble not supported")
+                return
+
+            with self._io_lock:
+                stopping = self._io_stop
+            if stopping:
+                # cleanup() gave up waiting for us, so nobody else will close the handle
+                sdl2.SDL_HapticClose(haptic)
+                return
+            self.haptic = haptic
+
+            effect = sdl2.SDL_HapticEffect()
+            effect.type = sdl2.SDL_HAPTIC_LEFTRIGHT
+            self._haptic_effect = effect
+        except Exception as e:
+            self.logger.errorw("Error initializing haptic feedback", "error", str(e))
+
+    def _start_io_thread(self):
+        """Start the thread that performs the controller writes."""
+        self._io_stop = False
+        self._io_thread = threading.Thread(target=self._io_loop, daemon=True)
+        self._io_thread.start()
+
+    def _stop_io_thread(self) -> bool:
+        """Flush pending writes and stop the I/O thread.
+
+        Returns:
+            bool: True if the thread stopped, False if it is still running
+        """
+        if not self._io_thread:
+            return True
+
+        with self._io_lock:
+            self._io_stop = True
+        self._io_event.set()
+        self._io_thread.join(timeout=1.0)
+        if self._io_thread.is_alive():
+            # Most likely still inside _init_haptic, which can block for seconds
+            return False
+
+        self._io_thread = None
+        return True
+
+    def _io_loop(self):
+        """Apply the latest pending LED and rumble values.
+
+        Values set faster than the controller accepts them overwrite each other in
+        the mailboxes, so stale updates are dropped instead of queued. Timed
+        rumbles are also stopped here, by waking up at their deadline, and
+        scheduled callbacks run here, so all controller writes happen on this
+        one thread.
+        """
+        # Haptics are only the fallback when the controller rumble API is missing
+        if self._sdl_rumble is None and self._hid_device is None:
+            self._init_haptic()
+
+        timers = self._io_timers
+        failing = False  # Whether the last iteration failed, so errors are logged once per streak
+        while True:
+            deadline = self._rumble_deadline
+            next_deadline = deadline
+            if timers and (next_deadline is None or timers[0][0] < next_deadline):
+                next_deadline = timers[0][0]
+            timeout = None if next_deadline is None else max(0.0, next_deadline - time.monotonic())
+            self._io_event.wait(timeout)
+            with self._io_lock:
+                self._io_event.clear()
+                led, self._pending_led = self._pending_led, None
+                rumble, self._pending_rumble = self._pending_rumble, None
+                stopping = self._io_stop
+
+            written = None  # Result of this iteration's write, None if nothing was written
+            try:
+                if rumble is None and deadline is not None and time.monotonic() >= deadline:
+                    # The timed rumble ran out without being replaced
+                    rumble = (0, 0, 0)
+                if led is not None or rumble is not None:
+                    written = self._write_state(led, rumble)
+
+                now = time.monotonic()
+                while timers and timers[0][0] <= now:
+                    _, _, callback = heapq.heappop(timers)
+                    callback()
+            except Exception as e:
+                # A disconnected controller fails every write; only the first one is logged
+                if not failing:
+                    self.logger.errorw("Error writing controller feedback", "error", str(e))
+                    failing = True
+            else:
+                if written is False:
+                    if not failing:
+                        self.logger.warnw("Controller feedback write failed")
+                        failing = True
+                elif written and failing:
+                    self.logger.infow("Controller feedback writes recovered")
+                    failing = False
+
+            if stopping:
+                return
+
+    def _schedule_io(self, delay_sec: float, callback) -> None:
+        """Run a callback on the I/O thread after a delay.
+
+        Must be called from the I/O thread.
+
+        Args:
+            delay_sec: Delay in seconds
+            callback: Function called without arguments
+        """
+        heapq.heappush(
+            self._io_timers, (time.monotonic() + delay_sec, next(self._io_timer_seq), callback)
+        )
+
     def set_led_color(self, r: int, g: int, b: int) -> bool:
         """Set the controller LED color.
 
+        The write is performed by the I/O thread.
+
         Args:
             r, g, b: Color values (0-255)
 
         Returns:
-            bool: Success or failure
+            bool: True if the update was queued
         """
         if not self.initialized or not self.sdl_controller:
             return False
 
-        try:
-            result = sdl2.SDL_GameControllerSetLED(self.sdl_controller, r, g, b)
-            return result == 0
-        except AttributeError:
-            self.logger.warnw("LED control not supported in this SDL2 version")
+        with self._io_lock:
+            self._pending_led = (r, g, b)
+        self._io_event.set()
+        return True
+
+    def _write_state(
+        self,
+        led: Optional[Tuple[int, int, int]],
+        rumble: Optional[Tuple[int, int, int]],
+    ) -> bool:
+        """Write LED and rumble changes, in one HID report when the device is open.
+
+        Args:
+            led: (r, g, b) color, or None to leave the LED unchanged
+            rumble: (low_freq, high_freq, duration_ms), or None to leave the rumble unchanged
+
+        Returns:
+            bool: Success or failure
+        """
+        if self._hid_device is not None:
+            if self._write_hid_report(led, rumble):
+                return True
+            # Retry the same update through SDL
+            self._close_hid_device()
+
+        success = True
+        if led is not None:
+            success = self._write_led_color(*led)
+        if rumble is not None:
+            success = self._write_rumble(*rumble) and success
+        return success
+
+    def _write_hid_report(
+        self,
+        led: Optional[Tuple[int, int, int]],
+        rumble: Optional[Tuple[int, int, int]],
+    ) -> bool:
+        """Write LED and rumble changes as a single DualSense output report."""
+        report = self._hid_report
+        changed = False
+
+        if led is not None and led != self._written_led:
+            report[HID_LED_RED : HID_LED_RED + 3] = bytes(led)
+            report[2] |= HID_FLAGS_LED
+            changed = True
+
+        state = None
+        if rumble is not None:
+            low_freq, high_freq, duration_ms = rumble
+            # A new rumble state replaces any pending timed stop
+            self._rumble_deadline = None
+            state = (_rumble_level(low_freq), _rumble_level(high_freq))
+            if state != self._written_rumble:
+                report[HID_LEFT_MOTOR] = state[0] >> 8
+                report[HID_RIGHT_MOTOR] = state[1] >> 8
+                report[1] |= HID_FLAGS_RUMBLE
+                changed = True
+
+        if changed:
+            try:
+                written = self._hid_device.write(bytes(report))
+            except Exception as e:
+                self.logger.warnw("Error writing DualSense HID report", "error", str(e))
+                return False
+            if written != HID_REPORT_SIZE:
+                self.logger.warnw("Short DualSense HID report write", "written", written)
+                return False
+
+            if led is not None:
+                self._written_led = led
+            if state is not None:
+                self._written_rumble = state
+
+        # Have the I/O loop stop the rumble after the requested duration
+        if state is not None and duration_ms > 0 and state != (0, 0):
+            self._rumble_deadline = time.monotonic() + max(duration_ms / 1000.0, 0.001)
+
+        return True
+
+    def _write_led_color(self, r: int, g: int, b: int) -> bool:
+        """Write the LED color to the controller."""
+        set_led = self._sdl_set_led
+        if set_led is None:
             return False
 
+        # Skip the write when the LED already shows this color
+        color = (r, g, b)
+        if color == self._written_led:
+            return True
+
+        result = set_led(self.sdl_controller, r, g, b)
+        self._written_led = color if result == 0 else None
+        return result == 0
+
     def set_rumble(self, low_freq: int = 0, high_freq: int = 0, duration_ms: int = 0) -> bool:
         """Set rumble effect with improved duration handling.
 
+        The write is performed by the I/O thread.
+
         Args:
             low_freq: Low frequency rumble intensity (0-65535)
             high_freq: High frequency rumble intensity (0-65535)
             duration_ms: Duration in milliseconds (0 = continuous until stopped)
 
         Returns:
-            bool: Success or failure
+            bool: True if the update was queued
         """
         if not self.initialized or not self.sdl_controller:
             return False
 
-        # Cancel any existing rumble timer
-        if self._rumble_timer:
-            self._rumble_timer.cancel()
-            self._rumble_timer = None
+        duration_ms = min(max(duration_ms, 0), MAX_RUMBLE_DURATION_MS)
+        with self._io_lock:
+            self._pending_rumble = (low_freq, high_freq, duration_ms)
+        self._io_event.set()
+        return True
 
-        try:
-            # Start the rumble with a very long duration or continuous
-            if low_freq == 0 and high_freq == 0:
-                # Just stopping the rumble
-                result = sdl2.SDL_GameControllerRumble(self.sdl_controller, 0, 0, 0)
-                return result == 0
-
-            # For non-zero rumble
-            if duration_ms > 0:
-                # Start rumble continuously - we'll stop it after the duration
-                result = sdl2.SDL_GameControllerRumble(
-                    self.sdl_controller, int(low_freq), int(high_freq), 0  # Continuous
-                )
-
-                # Schedule a timer to stop the rumble after the requested duration
-                if result == 0:
-                    # Convert ms to seconds for the timer
-                    duration_sec = max(duration_ms / 1000.0, 0.001)  # Minimum 1ms
-                    self._rumble_timer = threading.Timer(
-                        duration_sec,
-                        lambda: sdl2.SDL_GameControllerRumble(self.sdl_controller, 0, 0, 0),
-                    )
-                    self._rumble_timer.daemon = True
-                    self._rumble_timer.start()
-            else:
-                # Continuous rumble
-                result = sdl2.SDL_GameControllerRumble(
-                    self.sdl_controller, int(low_freq), int(high_freq), 0  # Continuous
-                )
+    def _write_rumble(self, low_freq: int, high_freq: int, duration_ms: int) -> bool:
+        """Write the rumble state to the controller."""
+        # A new rumble state replaces any pending timed stop
+        self._rumble_deadline = None
 
-            return result == 0
-        except AttributeError:
+        rumble = self._sdl_rumble
+        if rumble is None:
             # Fall back to haptic if available
             if self.haptic:
                 return self._set_haptic_rumble(low_freq, high_freq, duration_ms)
-            self.logger.warnw("Rumble not supported")
             return False
 
+        # The DualSense motors take 8-bit levels (SDL sends the high byte), so drop the
+        # low byte: intensities that produce the same report become the same state
+        state = (_rumble_level(low_freq), _rumble_level(high_freq))
+
+        # Skip the write when the motors already run at this state (e.g. repeated stops);
+        # a timed rumble then only moves its deadline
+        if state != self._written_rumble:
+            # Rumble is started continuously - a timed rumble is stopped after the duration
+            result = rumble(self.sdl_controller, state[0], state[1], 0)
+            self._written_rumble = state if result == 0 else None
+            if result != 0:
+                return False
+
+        # Have the I/O loop stop the rumble after the requested duration
+        if duration_ms > 0 and state != (0, 0):
+            duration_sec = max(duration_ms / 1000.0, 0.001)  # Minimum 1ms
+            self._rumble_deadline = time.monotonic() + duration_sec
+
+        return True
+
+    def set_state(
+        self,
+        led_color: Optional[Tuple[int, int, int]] = None,
+        rumble: Optional[Tuple[int, int]] = None,
+        duration_ms: int = 0,
+    ) -> bool:
+        """Apply LED color and rumble together as a single feedback step.
+
+        Both values are handed to the I/O thread in one update. Fields left as
+        None are not touched, and a step with neither field set issues no write.
+
+        Args:
+            led_color: (r, g, b) color values (0-255), or None to keep the current color
+            rumble: (low_freq, high_freq) intensities (0-65535), or None to keep the current rumble
+            duration_ms: Rumble duration in milliseconds (0 = continuous until stopped)
+
+        Returns:
+            bool: True if the update was queued or there was nothing to apply
+        """
+        if led_color is None and rumble is None:
+            return True
+
+        if not self.initialized or not self.sdl_controller:
+            return False
+
+        with self._io_lock:
+            if led_color is not None:
+                self._pending_led = led_color
+            if rumble is not None:
+                duration_ms = min(max(duration_ms, 0), MAX_RUMBLE_DURATION_MS)
+                self._pending_rumble = (rumble[0], rumble[1], duration_ms)
+        self._io_event.set()
+        return True
+
     def _set_haptic_rumble(self, low_freq: int, high_freq: int, duration_ms: int) -> bool:
-        """Alternative method using haptic interface with improved handling."""
-        if not self.haptic:
+        """Alternative method using haptic interface with improved handling.
+
+        A single LEFTRIGHT effect is created on first use and updated in place
+        afterwards; it is destroyed in cleanup().
+        """
+        if not self.haptic or self._haptic_effect is None:
             return False
 
         try:
-            import ctypes
-
             # Convert 0-65535 to 0-32767 for SDL haptic
-            low = min(32767, int(low_freq / 2))
-            high = min(32767, int(high_freq / 2))
+            low = min(32767, max(0, int(low_freq / 2)))
+            high = min(32767, max(0, int(high_freq / 2)))
 
             # For zero vibration, just stop effects
             if low == 0 and high == 0:
                 sdl2.SDL_HapticStopAll(self.haptic)
                 return True
 
-            # For non-zero vibration
-            effect = sdl2.SDL_HapticEffect()
-            effect.type = sdl2.SDL_HAPTIC_LEFTRIGHT
+            # For non-zero vibration, reuse a single effect and update it in place
+            effect = self._haptic_effect
+
+            duration_ms = min(max(duration_ms, 0), MAX_RUMBLE_DURATION_MS)
 
             # Use continuous effect for very short durations, we'll manage timing
             if duration_ms <= 10:
@@ -205,34 +625,38 @@ class DualSenseFeedback:
             effect.leftright.large_magnitude = low
             effect.leftright.small_magnitude = high
 
-            effect_id = sdl2.SDL_HapticNewEffect(self.haptic, ctypes.byref(effect))
-            if effect_id >= 0:
-                sdl2.SDL_HapticRunEffect(self.haptic, effect_id, 1)
-
-                # For very short durations, manually stop after the requested time
-                if duration_ms > 0 and duration_ms <= 10:
-                    # Use a timer to stop the effect
-                    threading.Timer(
-                        duration_ms / 1000.0,
-                        lambda: (
-                            sdl2.SDL_HapticStopEffect(self.haptic, effect_id),
-                            sdl2.SDL_HapticDestroyEffect(self.haptic, effect_id),
-                        ),
-                    ).start()
-                elif duration_ms > 10:
-                    # Auto cleanup after duration for longer effects
-                    threading.Timer(
-                        duration_ms / 1000.0,
-                        lambda: sdl2.SDL_HapticDestroyEffect(self.haptic, effect_id),
-                    ).start()
+            effect_id = self._haptic_effect_id
+            if effect_id is None:
+                effect_id = sdl2.SDL_HapticNewEffect(self.haptic, _byref(effect))
+                if effect_id < 0:
+                    return False
+                self._haptic_effect_id = effect_id
+            elif sdl2.SDL_HapticUpdateEffect(self.haptic, effect_id, _byref(effect)) != 0:
+                return False
 
-                return True
+            sdl2.SDL_HapticRunEffect(self.haptic, effect_id, 1)
+            self._haptic_run += 1
 
-            return False
+            # For very short durations, manually stop after the requested time,
+            # unless the effect has been run again by then
+            if duration_ms > 0 and duration_ms <= 10:
+                run = self._haptic_run
+                self._schedule_io(duration_ms / 1000.0, lambda: self._stop_haptic_effect(run))
+
+            return True
         except Exception as e:
             self.logger.errorw("Error setting haptic rumble", "error", str(e))
             return False
 
+    def _stop_haptic_effect(self, run: int) -> None:
+        """Stop the haptic effect if it has not been run again since the given run.
+
+        Args:
+            run: Value of the run counter when the stop was scheduled
+        """
+        if run == self._haptic_run and self.haptic:
+            sdl2.SDL_HapticStopEffect(self.haptic, self._haptic_effect_id)
+
     def pulse_rumble(
         self, intensity: int = 32767, duration_sec: float = 5, pattern_ms: int = 500
     ) -> bool:
@@ -263,42 +687,37 @@ class DualSenseFeedback:
 
     def _pulse_rumble_thread(self, intensity: int, duration_sec: float, pattern_ms: int):
         """Thread function for pulsing rumble."""
-        start_time = time.time()
+        # Monotonic, so wall clock adjustments do not cut the pulsing short or extend it
+        deadline_ns = time.monotonic_ns() + int(duration_sec * 1_000_000_000)
 
         while not self._stop_rumble.is_set():
             # Check if total duration has elapsed
-            if duration_sec > 0 and (time.time() - start_time) > duration_sec:
+            if duration_sec > 0 and time.monotonic_ns() >= deadline_ns:
                 break
 
             # Rumble on - use manual timing for short durations
             on_duration = max(50, pattern_ms // 2)  # Minimum 50ms for better perception
             self.set_rumble(intensity, intensity, on_duration)
 
-            # Sleep slightly less than the rumble duration to minimize gaps
+            # Wait slightly less than the rumble duration to minimize gaps,
+            # returning right away if stop_rumble() is called
             sleep_time = on_duration / 1000.0 * 0.8  # 80% of the on duration
-            time.sleep(sleep_time)
-
-            # Check if we should stop
-            if self._stop_rumble.is_set():
+            if self._stop_rumble.wait(sleep_time):
                 break
 
             # Explicit rumble off
             self.set_rumble(0, 0, 0)
 
-            # Sleep for off duration
+            # Wait for off duration
             off_duration = pattern_ms / 2000.0
-            time.sleep(off_duration)
+            if self._stop_rumble.wait(off_duration):
+                break
 
         # Ensure rumble is off
         self.set_rumble(0, 0, 0)
 
     def stop_rumble(self):
         """Stop any active rumble effects."""
-        # Cancel any rumble timer
-        if self._rumble_timer and self._rumble_timer.is_alive():
-            self._rumble_timer.cancel()
-            self._rumble_timer = None
-
         # Stop pulsing thread if running
         if self._rumble_thread and self._rumble_thread.is_alive():
             self._stop_rumble.set()
@@ -311,13 +730,18 @@ class DualSenseFeedback:
     def cleanup(self):
         """Clean up resources."""
         self.stop_rumble()
-
-        # Cancel any rumble timer
-        if self._rumble_timer and self._rumble_timer.is_alive():
-            self._rumble_timer.cancel()
-            self._rumble_timer = None
+        if not self._stop_io_thread():
+            # The thread may still be using the devices; closing them under it would
+            # crash SDL, so leave them to be released when the process exits
+            self.logger.warnw("Skipping controller feedback cleanup while the I/O thread runs")
+            return
+        self._close_hid_device()
 
         if self.haptic:
+            if self._haptic_effect_id is not None:
+                sdl2.SDL_HapticDestroyEffect(self.haptic, self._haptic_effect_id)
+                self._haptic_effect_id = None
+                self._haptic_effect = None
             sdl2.SDL_HapticClose(self.haptic)
             self.haptic = None
 
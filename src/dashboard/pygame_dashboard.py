@@ -9,6 +9,7 @@ import math
 import os
 import sys
 import time
+from collections import deque
 
 import numpy as np
 import pygame
@@ -32,6 +33,13 @@ from src.common.enum.movement import (
     TurnType,
 )
 from src.common.logging.logger_api import Logger
+from src.dashboard.dualsense.base_controller import (
+    JOYSTICK_DEVICE_EVENT_TYPES,
+    JOYSTICK_EVENT_TYPES,
+)
+
+# Upper bound on camera frame timestamps kept for the FPS readout (2 s window at 60 FPS)
+FRAME_TIMES_MAXLEN = 120
 
 
 class RasptankPygameDashboard:
@@ -104,6 +112,9 @@ class RasptankPygameDashboard:
         # Load fonts
         self.load_fonts()
 
+        # Rendered surfaces of fixed labels, keyed by (font, text, color)
+        self._text_cache = {}
+
         # Initialize emoji renderer
         self.emoji_renderer = EmojiRenderer()
 
@@ -207,6 +218,27 @@ class RasptankPygameDashboard:
                 "large": pygame.font.Font(None, 42),
             }
 
+    def render_static_text(self, font_key, text, color):
+        """Render a fixed label once and reuse the surface on later frames.
+
+        Only use this for text drawn from a small fixed set, since every
+        distinct (font, text, color) combination stays cached.
+
+        Args:
+            font_key: Key of the font in self.fonts
+            text: Text to render
+            color: Text color
+
+        Returns:
+            pygame.Surface: Rendered text
+        """
+        key = (font_key, text, color)
+        surface = self._text_cache.get(key)
+        if surface is None:
+            surface = self.fonts[font_key].render(text, True, color)
+            self._text_cache[key] = surface
+        return surface
+
     def prerender_emojis(self):
         """Pre-render all emoji characters to surfaces."""
         for key, emoji in self.emojis.items():
@@ -262,8 +294,10 @@ class RasptankPygameDashboard:
         if not self.running:
             return False
 
-        # Check for window close event
-        for event in pygame.event.get():
+        # Check for window close event (controller input and hot-plug events are left queued)
+        for event in pygame.event.get(
+            exclude=(*JOYSTICK_EVENT_TYPES, *JOYSTICK_DEVICE_EVENT_TYPES)
+        ):
             if event.type == pygame.QUIT:
                 if not self.shutting_down:
                     # Start the shutdown sequence
@@ -336,8 +370,8 @@ class RasptankPygameDashboard:
         )
 
         # Draw header text with glow effect
-        header_text = self.fonts["header"].render(
-            "RASPTANK CONTROL DASHBOARD", True, self.colors["header"]
+        header_text = self.render_static_text(
+            "header", "RASPTANK CONTROL DASHBOARD", self.colors["header"]
         )
         glow_value = int(20 + 20 * self.pulse_effect)  # Subtle glow
         glow_color = (
@@ -347,7 +381,7 @@ class RasptankPygameDashboard:
         )
 
         # Draw glow effect
-        glow_text = self.fonts["header"].render("RASPTANK CONTROL DASHBOARD", True, glow_color)
+        glow_text = self.render_static_text("header", "RASPTANK CONTROL DASHBOARD", glow_color)
         glow_rect = glow_text.get_rect(
             centerx=header_rect.width // 2, centery=header_rect.height // 2
         )
@@ -401,7 +435,7 @@ class RasptankPygameDashboard:
             text_x += icon_surface.get_width() + 5
 
         # Draw section title
-        title_text = self.fonts["title"].render(title, True, self.colors["text"])
+        title_text = self.render_static_text("title", title, self.colors["text"])
         self.window.blit(
             title_text,
             (text_x, header_rect.y + (self.section_header_height - title_text.get_height()) // 2),
@@ -455,7 +489,7 @@ class RasptankPygameDashboard:
         status_color = self.colors["green"] if self.tank_status["connected"] else self.colors["red"]
         status_text = "Connected" if self.tank_status["connected"] else "Disconnected"
 
-        conn_label = self.fonts["normal"].render("Connection:", True, self.colors["text"])
+        conn_label = self.render_static_text("normal", "Connection:", self.colors["text"])
         conn_value = self.fonts["normal"].render(status_text, True, status_color)
 
         self.window.blit(conn_label, (body_rect.x + 20, body_rect.y + 20))
@@ -469,7 +503,7 @@ class RasptankPygameDashboard:
                 battery_pct = self.tank_status["battery"]
                 battery_color = self.get_battery_color(battery_pct)
 
-                batt_label = self.fonts["normal"].render("Battery:", True, self.colors["text"])
+                batt_label = self.render_static_text("normal", "Battery:", self.colors["text"])
                 batt_value = self.fonts["normal"].render(f"{battery_pct}%", True, battery_color)
 
                 self.window.blit(batt_label, (body_rect.x + 20, body_rect.y + 55))
@@ -550,7 +584,7 @@ class RasptankPygameDashboard:
                         )
             else:
                 # Power source is not battery
-                batt_label = self.fonts["normal"].render("Power Source:", True, self.colors["text"])
+                batt_label = self.render_static_text("normal", "Power Source:", self.colors["text"])
                 batt_value = self.fonts["normal"].render(
                     self.tank_status["power_source"].capitalize(), True, self.colors["text"]
                 )
@@ -587,7 +621,7 @@ class RasptankPygameDashboard:
                 update_text = "Never"
                 text_color = self.colors["text_secondary"]
 
-            update_label = self.fonts["normal"].render("Last Update:", True, self.colors["text"])
+            update_label = self.render_static_text("normal", "Last Update:", self.colors["text"])
             update_value = self.fonts["normal"].render(update_text, True, text_color)
 
             if self.tank_status["power_source"] == "battery":
@@ -604,8 +638,8 @@ class RasptankPygameDashboard:
                 )
         else:
             # If not connected, show a message
-            disconnected_text = self.fonts["normal"].render(
-                "Tank not connected", True, self.colors["text_secondary"]
+            disconnected_text = self.render_static_text(
+                "normal", "Tank not connected", self.colors["text_secondary"]
             )
             self.window.blit(
                 disconnected_text,
@@ -647,7 +681,7 @@ class RasptankPygameDashboard:
                 min(255, status_color[2] + pulse),
             )
 
-        conn_label = self.fonts["normal"].render("Connection:", True, self.colors["text"])
+        conn_label = self.render_static_text("normal", "Connection:", self.colors["text"])
         conn_value = self.fonts["normal"].render(status_text, True, status_color)
 
         self.window.blit(conn_label, (body_rect.x + 20, body_rect.y + 20))
@@ -665,7 +699,7 @@ class RasptankPygameDashboard:
             "Enabled" if self.controller_status.get("has_feedback", False) else "Disabled"
         )
 
-        feedback_label = self.fonts["normal"].render("Feedback:", True, self.colors["text"])
+        feedback_label = self.render_static_text("normal", "Feedback:", self.colors["text"])
         feedback_value = self.fonts["normal"].render(feedback_text, True, feedback_color)
 
         self.window.blit(feedback_label, (body_rect.x + 20, body_rect.y + 55))
@@ -683,8 +717,8 @@ class RasptankPygameDashboard:
             if len(buttons_text) > 30:
                 buttons_text = buttons_text[:27] + "..."
 
-            buttons_label = self.fonts["normal"].render(
-                "Active Buttons:", True, self.colors["text"]
+            buttons_label = self.render_static_text(
+                "normal", "Active Buttons:", self.colors["text"]
             )
             buttons_value = self.fonts["normal"].render(buttons_text, True, self.colors["cyan"])
 
@@ -725,7 +759,7 @@ class RasptankPygameDashboard:
         elif speed_value >= 50:
             speed_color = self.colors["teal"]
 
-        speed_label = self.fonts["normal"].render("Speed Mode:", True, self.colors["text"])
+        speed_label = self.render_static_text("normal", "Speed Mode:", self.colors["text"])
         speed_value_text = self.fonts["normal"].render(
             f"{speed_mode} ({speed_value}%)", True, speed_color
         )
@@ -772,7 +806,7 @@ class RasptankPygameDashboard:
             movement_text = "Stopped"
             text_color = self.colors["text_secondary"]
 
-        movement_label = self.fonts["normal"].render("Movement:", True, self.colors["text"])
+        movement_label = self.render_static_text("normal", "Movement:", self.colors["text"])
         movement_value = self.fonts["normal"].render(movement_text, True, text_color)
 
         self.window.blit(movement_label, (body_rect.x + 15, body_rect.y + 70))
@@ -833,8 +867,8 @@ class RasptankPygameDashboard:
             )
 
         # Draw joystick text labels
-        x_label = self.fonts["small"].render("X", True, self.colors["text_secondary"])
-        y_label = self.fonts["small"].render("Y", True, self.colors["text_secondary"])
+        x_label = self.render_static_text("small", "X", self.colors["text_secondary"])
+        y_label = self.render_static_text("small", "Y", self.colors["text_secondary"])
 
         # Position labels
         self.window.blit(
@@ -978,7 +1012,7 @@ class RasptankPygameDashboard:
                             self.frame_times.append(current_time)
                             # Keep only recent frames for FPS calculation (last ~2 seconds)
                             while self.frame_times and current_time - self.frame_times[0] > 2.0:
-                                self.frame_times.pop(0)
+                                self.frame_times.popleft()
 
                             # Calculate actual FPS based on frame count over time period
                             if len(self.frame_times) > 1:
@@ -1000,14 +1034,16 @@ class RasptankPygameDashboard:
                                     )
                         else:
                             # Initialize frame tracking
-                            self.frame_times = [current_time]
+                            self.frame_times = deque([current_time], maxlen=FRAME_TIMES_MAXLEN)
 
                         # Remember this frame
                         self.last_frame_id = current_frame_id
                 else:
                     # Initialize frame tracking
                     self.last_frame_id = id(self.camera_feed) if self.camera_feed else None
-                    self.frame_times = [current_time] if self.camera_feed else []
+                    self.frame_times = deque(
+                        [current_time] if self.camera_feed else [], maxlen=FRAME_TIMES_MAXLEN
+                    )
         else:
             # Show placeholder text
             if camera_connected:
@@ -1095,11 +1131,11 @@ class RasptankPygameDashboard:
             y_pos = body_rect.y + 15 + (i * 30)
 
             # Control label with slight styling
-            control_label = self.fonts["normal"].render(control + ":", True, self.colors["accent"])
+            control_label = self.render_static_text("normal", control + ":", self.colors["accent"])
             self.window.blit(control_label, (body_rect.x + 20, y_pos))
 
             # Description with padding
-            desc_label = self.fonts["normal"].render(description, True, self.colors["text"])
+            desc_label = self.render_static_text("normal", description, self.colors["text"])
             self.window.blit(desc_label, (body_rect.x + 120, y_pos))
 
     def draw_shutdown_overlay(self):
@@ -1143,7 +1179,7 @@ class RasptankPygameDashboard:
         pygame.draw.rect(self.window, self.colors["border"], msg_rect, width=2, border_radius=10)
 
         # Draw message
-        title_text = self.fonts["large"].render("Shutting Down", True, self.colors["red"])
+        title_text = self.render_static_text("large", "Shutting Down", self.colors["red"])
         title_rect = title_text.get_rect(centerx=msg_rect.centerx, top=msg_rect.top + 30)
         self.window.blit(title_text, title_rect)
 
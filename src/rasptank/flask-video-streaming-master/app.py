@@ -92,9 +92,7 @@ class RequestFilter:
             return True
 
         # Always log requests that aren't to our high-volume endpoints
-        if not request.path.startswith("/latest_frame") and not request.path.startswith(
-            "/video_feed"
-        ):
+        if not request.path.startswith(("/latest_frame", "/video_feed", "/fps")):
             return True
 
         # For high-volume endpoints, track counts and log periodically
@@ -216,7 +214,7 @@ def gen(camera, client_ip=None, stream_id=None):
 
     stream_instance_logger.infow("Starting new video stream")
 
-    prev_time = time.time()
+    prev_time_ns = time.monotonic_ns()
     frame_count = 0
     fps = 0
     total_frames = 0
@@ -226,8 +224,8 @@ def gen(camera, client_ip=None, stream_id=None):
         while True:
             frame_start = time.time()
 
-            # Capture a frame with FPS displayed
-            frame = camera.get_frame(fps=fps)
+            # Capture a frame
+            frame = camera.get_frame()
             if frame is None:
                 stream_instance_logger.warnw("Empty frame received from camera")
                 time.sleep(0.1)
@@ -238,7 +236,7 @@ def gen(camera, client_ip=None, stream_id=None):
 
             # Calculate elapsed time
             current_time = time.time()
-            elapsed_time = current_time - prev_time
+            current_time_ns = time.monotonic_ns()
             frame_time = current_time - frame_start
 
             # Log occasional statistics
@@ -259,10 +257,10 @@ def gen(camera, client_ip=None, stream_id=None):
                     f"{frame_time*1000:.2f}ms",
                 )
 
-            if elapsed_time >= 1.0:  # Update FPS every second
+            if current_time_ns - prev_time_ns >= 1_000_000_000:  # Update FPS every second
                 fps = frame_count
                 frame_count = 0
-                prev_time = current_time
+                prev_time_ns = current_time_ns
 
             yield b"--frame\r\n"
             yield b"Content-Type: image/jpeg\r\n\r\n"
@@ -351,6 +349,23 @@ def latest_frame():
         return Response(f"Camera error: {str(e)}", status=500, mimetype="text/plain")
 
 
+@app.route("/fps")
+def fps():
+    """Endpoint returning the camera capture rate, drawn as an overlay by the page."""
+    try:
+        return jsonify({"fps": get_camera().fps})
+    except Exception as e:
+        http_logger.errorw(
+            "Error in fps endpoint",
+            "error",
+            str(e),
+            "remote_addr",
+            request.remote_addr,
+            exc_info=True,
+        )
+        return jsonify({"fps": None, "error": str(e)}), 500
+
+
 @app.route("/read_qr")
 def read_qr():
     """Endpoint to read QR codes from the current frame."""
@@ -117,6 +117,7 @@ class BaseCamera:
     last_access = 0  # Time of last client access to the camera
     event = None  # CameraEvent instance
     logger = None  # Logger instance
+    fps = 0  # Capture rate measured by the background thread, shared by all clients
 
     def __init__(self):
         """
@@ -183,6 +184,8 @@ class BaseCamera:
         frames_iterator = None
         frame_count = 0
         start_time = time.time()
+        fps_window_start_ns = time.monotonic_ns()
+        fps_window_frames = 0
 
         try:
             # Get a reference to the frames iterator
@@ -194,6 +197,14 @@ class BaseCamera:
                 BaseCamera.event.set()  # Send signal to clients
                 frame_count += 1
 
+                # Update the shared FPS once per second
+                fps_window_frames += 1
+                now_ns = time.monotonic_ns()
+                if now_ns - fps_window_start_ns >= 1_000_000_000:
+                    BaseCamera.fps = fps_window_frames
+                    fps_window_frames = 0
+                    fps_window_start_ns = now_ns
+
                 # Log stats occasionally
                 if frame_count % 100 == 0:
                     elapsed = time.time() - start_time
@@ -239,4 +250,5 @@ class BaseCamera:
                 "run_time",
                 f"{time.time() - start_time:.1f}s",
             )
+            BaseCamera.fps = 0  # Not capturing anymore
             BaseCamera.thread = None
@@ -83,35 +83,14 @@ class Camera(BaseCamera):
                 frames_logger.infow("Stopping camera")
                 camera.stop()
 
-    def get_frame(self, fps=None):
-        """Return the current camera frame with optional FPS display."""
-        try:
-            frame_bytes = super().get_frame()
-
-            # If FPS is not required, return the frame as is
-            if fps is None:
-                return frame_bytes
-
-            # Add FPS info to the frame
-            try:
-                # Convert jpeg to numpy array
-                nparr = np.frombuffer(frame_bytes, np.uint8)
-                img = cv2.imdecode(nparr, cv2.IMREAD_COLOR)
+    def get_frame(self):
+        """Return the current camera frame.
 
-                # Add FPS text
-                cv2.putText(
-                    img, f"FPS: {fps}", (10, 30), cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 255, 0), 2
-                )
-
-                # Encode the modified image back to jpeg
-                _, jpeg = cv2.imencode(".jpg", img)
-                return jpeg.tobytes()
-            except Exception as e:
-                self.processing_logger.errorw(
-                    "Error adding FPS to frame", "error", str(e), "fps", fps, exc_info=True
-                )
-                # Return original frame if there's an error
-                return frame_bytes
+        The FPS readout is drawn by the browser from /fps, so frames are passed
+        through exactly as captured.
+        """
+        try:
+            return super().get_frame()
         except Exception as e:
             self.processing_logger.errorw(
                 "Error getting camera frame", "error", str(e), exc_info=True
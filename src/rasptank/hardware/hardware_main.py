@@ -1,5 +1,6 @@
 """Hardware-specific implementation for Rasptank."""
 
+import os
 from queue import Queue
 
 from RPi import GPIO
@@ -48,7 +49,11 @@ class RasptankHardware:
 
         # Initialize LED strip
         led_strip_logger = hw_logger.with_component("LedStrip")
-        self.led_strip = RasptankLedStrip(led_strip_logger)
+        # Real-time scheduling keeps animations smooth but needs CAP_SYS_NICE, so it is opt-in
+        self.led_strip = RasptankLedStrip(
+            led_strip_logger,
+            realtime_priority=os.environ.get("RASPTANK_LED_REALTIME_PRIORITY", "0") == "1",
+        )
         self.led_command_queue = Queue()
 
         # Initialize IR emitter
@@ -1,5 +1,6 @@
 """This module contains the LedAnimationThread class, which is responsible for controlling the LED animations on the robot."""
 
+import os
 import threading
 import time
 
@@ -14,19 +15,28 @@ class AnimationType:
 
 
 class LedAnimationThread(threading.Thread):
-    def __init__(self, color_setter, team_color):
+    def __init__(self, color_setter, team_color, realtime_priority=False, on_priority=None):
         super().__init__()
         self.color_setter = color_setter
         self.team_color = team_color
         self.current_animation = AnimationType.TEAM_COLOR
         self.animation_duration = 0
-        self.animation_end_time = time.time()
+        self.animation_end_time = time.monotonic()
         self.running = True
         self.lock = threading.Lock()
+        # Opt-in, since raising the priority needs CAP_SYS_NICE
+        self.realtime_priority = realtime_priority
+        # Called from the thread with the priority outcome (see _raise_priority)
+        self.on_priority = on_priority
 
     def run(self):
+        if self.realtime_priority:
+            outcome = self._raise_priority()
+            if self.on_priority:
+                self.on_priority(outcome)
+
         while self.running:
-            now = time.time()
+            now = time.monotonic()
             with self.lock:
                 if now > self.animation_end_time:
                     self.current_animation = AnimationType.TEAM_COLOR
@@ -42,12 +52,32 @@ class LedAnimationThread(threading.Thread):
         with self.lock:
             self.current_animation = animation_type
             self.animation_duration = duration
-            self.animation_end_time = time.time() + duration
+            self.animation_end_time = time.monotonic() + duration
 
     def stop_animation(self):
         with self.lock:
             # Force current animation to expire immediately
-            self.animation_end_time = time.time() - 1  # Ensures immediate stop
+            self.animation_end_time = time.monotonic() - 1  # Ensures immediate stop
+
+    @staticmethod
+    def _raise_priority():
+        """Schedule the calling thread round-robin so busy threads don't delay LED updates.
+
+        Falls back to a lower nice value, then to the default priority, when the
+        process lacks the privileges for real-time scheduling.
+
+        Returns:
+            str: Priority applied: "realtime", "nice" or "default"
+        """
+        try:
+            os.sched_setscheduler(0, os.SCHED_RR, os.sched_param(10))
+            return "realtime"
+        except (AttributeError, OSError):
+            try:
+                os.nice(-5)
+                return "nice"
+            except OSError:
+                return "default"
 
     def execute_current_animation(self):
         # Implement your actual animation patterns here
@@ -24,12 +24,21 @@ class LedStripState(Enum):
 class RasptankLedStrip:
     """Class for controlling the LED strip on the Rasptank."""
 
-    def __init__(self, led_strip_logger: Logger):
-        """Initialize the LED strip."""
+    def __init__(self, led_strip_logger: Logger, realtime_priority: bool = False):
+        """Initialize the LED strip.
+
+        Args:
+            led_strip_logger: Logger instance
+            realtime_priority: Run the animation thread with real-time scheduling
+                (needs CAP_SYS_NICE)
+        """
         # Create logger
         self.logger = led_strip_logger
         self.logger.infow("Initializing Rasptank LED strip")
 
+        # set_color runs on every animation step, so only build debug args when needed
+        self._debug_enabled = self.logger.is_debug_enabled()
+
         # LED strip configuration
         self.LED_COUNT = 12  # Number of LED pixels
         self.LED_PIN = 12  # GPIO pin connected to the pixels
@@ -78,18 +87,35 @@ class RasptankLedStrip:
 
         # Start the animation thread
         self.logger.debugw("Starting LED animation thread")
-        self.animation_thread = LedAnimationThread(self.set_color, self.team_color)
+        self.animation_thread = LedAnimationThread(
+            self.set_color,
+            self.team_color,
+            realtime_priority=realtime_priority,
+            on_priority=self._log_animation_priority,
+        )
         self.animation_thread.start()
 
         self.logger.infow("LED strip initialized")
 
+    def _log_animation_priority(self, outcome):
+        """Report the scheduling priority the animation thread ended up with."""
+        if outcome == "realtime":
+            self.logger.infow("LED animation thread running with real-time priority")
+        else:
+            self.logger.warnw(
+                "Could not give the LED animation thread real-time priority",
+                "fallback",
+                outcome,
+            )
+
     def set_color(self, color):
         """Set all LEDs to the same color."""
         try:
             # Extract RGB components
             r, g, b = color
 
-            self.logger.debugw("Setting LED color", "r", r, "g", g, "b", b)
+            if self._debug_enabled:
+                self.logger.debugw("Setting LED color", "r", r, "g", g, "b", b)
 
             # Set each pixel's color
             for i in range(self.strip.numPixels()):
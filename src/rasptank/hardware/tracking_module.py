@@ -33,5 +33,5 @@ class TrackingModule:
 
     def is_white_in_middle(self) -> bool:
         _, status_middle, _ = self._get_tracking_module_status()
-        self.logger.debugw(f"Tracking module status: {status_middle}")
+        self.logger.debugw("Tracking module status", "middle", status_middle)
         return status_middle == 0